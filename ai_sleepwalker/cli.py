@@ -4,25 +4,32 @@ This module provides a user-friendly CLI using Click that allows users
 to configure and run the sleepwalker with custom options.
 """
 
-import asyncio
-import logging
 import os
 from pathlib import Path
 
 import click
 
-from .main import start_sleepwalking
+from .constants import default_output_directory
 
-# Suppress verbose LLM output for cleaner CLI experience
-os.environ["LITELLM_LOG"] = "ERROR"
-logging.getLogger("LiteLLM").setLevel(logging.ERROR)
-logging.getLogger("httpx").setLevel(logging.WARNING)
-logging.getLogger("aiohttp").setLevel(logging.WARNING)
 
-# Configure logging for CLI
-logging.basicConfig(
-    level=logging.INFO, format="%(asctime)s - %(message)s", datefmt="%Y-%m-%d %H:%M:%S"
-)
+def _configure_logging() -> None:
+    """Configure logging for a real run.
+
+    Kept out of module scope so ``--help`` and argument errors don't pay for
+    logging setup or LiteLLM environment tweaks.
+    """
+    import logging
+
+    # Suppress verbose LLM output for cleaner CLI experience
+    os.environ.setdefault("LITELLM_LOG", "ERROR")
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s - %(message)s",
+        datefmt="%Y-%m-%d %H:%M:%S",
+    )
+    logging.getLogger("LiteLLM").setLevel(logging.ERROR)
+    for name in ("httpx", "aiohttp"):
+        logging.getLogger(name).setLevel(logging.WARNING)
 
 
 @click.command()
@@ -47,7 +54,7 @@ logging.basicConfig(
 @click.option(
     "--output-dir",
     type=click.Path(),
-    default="~/.sleepwalker/dreams",
+    default=lambda: str(default_output_directory()),
     help="Directory to save experience logs",
 )
 @click.option(
@@ -111,6 +118,12 @@ def sleepwalk(
 
     click.echo("\n🚀 Starting sleepwalker...\n")
 
+    # Heavy imports (LiteLLM, wakepy) are deferred until we actually run
+    import asyncio
+
+    _configure_logging()
+    from .main import start_sleepwalking
+
     # Run the main sleepwalking function
     try:
         asyncio.run(
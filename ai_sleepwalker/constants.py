@@ -31,9 +31,18 @@ class FileExtension(Enum):
 
 # Default configuration values
 DEFAULT_IDLE_TIMEOUT_SECONDS = 900  # 15 minutes
-DEFAULT_OUTPUT_DIRECTORY = Path.home() / ".sleepwalker" / "dreams"
 DEFAULT_EXPERIENCE_MODE = ExperienceMode.DREAM
 
+
+def default_output_directory() -> Path:
+    """Default directory for saved dreams.
+
+    A function rather than a constant so importing this module doesn't
+    look up the home directory.
+    """
+    return Path.home() / ".sleepwalker" / "dreams"
+
+
 # File size limits
 MAX_FILE_PREVIEW_SIZE_BYTES = 2048  # 2KB for text preview (increased for more content)
 MIN_FILE_SIZE_BYTES = 50  # Minimum file size to consider (filter out tiny files)
@@ -44,6 +53,8 @@ MAX_EXPLORATION_DEPTH = 3  # Maximum directory depth to explore
 DEFAULT_LLM_MODEL = "gemini/gemini-2.5-flash-preview-05-20"
 LLM_MAX_TOKENS = 2048
 LLM_TEMPERATURE = 0.7
+PROMPT_PREVIEW_TOKEN_BUDGET = 200  # Max preview tokens per observation in a prompt
+APPROX_CHARS_PER_TOKEN = 4  # Rough English average, good enough for budgeting
 
 # Safety limits
 MAX_DISCOVERIES_PER_SESSION = 100
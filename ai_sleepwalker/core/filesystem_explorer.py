@@ -1,9 +1,18 @@
 """Safe filesystem exploration with security boundaries."""
 
+import asyncio
+import bisect
 import logging
+import os
 import random
+import threading
 import time
+from collections.abc import Iterator
+from dataclasses import dataclass, field
+from enum import Enum
+from itertools import islice
 from pathlib import Path
+from typing import TypeVar
 
 from ..constants import (
     MAX_DISCOVERIES_PER_SESSION,
@@ -18,6 +27,210 @@ from ..models import FileSystemDiscovery
 logger = logging.getLogger(__name__)
 
 
+# Extensions treated as readable text when choosing files to preview
+TEXT_FILE_EXTENSIONS = frozenset(
+    {
+        ".txt",
+        ".md",
+        ".py",
+        ".js",
+        ".json",
+        ".xml",
+        ".html",
+        ".css",
+        ".yml",
+        ".yaml",
+        ".toml",
+        ".ini",
+        ".cfg",
+        ".conf",
+        ".log",
+        ".sh",
+        ".bash",
+        ".zsh",
+        ".fish",
+        ".ps1",
+        ".bat",
+        ".cmd",
+        ".sql",
+        ".rs",
+        ".go",
+        ".java",
+        ".cpp",
+        ".c",
+        ".h",
+        ".hpp",
+        ".php",
+        ".rb",
+        ".pl",
+        ".lua",
+        ".r",
+        ".scala",
+        ".kt",
+        ".swift",
+        ".ts",
+        ".jsx",
+        ".tsx",
+        ".vue",
+        ".svelte",
+        ".cs",
+        ".vb",
+        ".fs",
+        ".clj",
+        ".lisp",
+        ".scm",
+        ".hs",
+        ".elm",
+        ".ex",
+        ".exs",
+        ".erl",
+        ".dart",
+        ".groovy",
+        ".kts",
+        ".gradle",
+        ".sbt",
+        ".dockerfile",
+    }
+)
+
+
+# Common binary extensions, skipped without reading the file
+BINARY_FILE_EXTENSIONS = frozenset(
+    {
+        ".exe",
+        ".dll",
+        ".so",
+        ".dylib",
+        ".bin",
+        ".o",
+        ".obj",
+        ".jpg",
+        ".jpeg",
+        ".png",
+        ".gif",
+        ".bmp",
+        ".tiff",
+        ".webp",
+        ".mp3",
+        ".mp4",
+        ".wav",
+        ".flac",
+        ".avi",
+        ".mov",
+        ".mkv",
+        ".pdf",
+        ".doc",
+        ".docx",
+        ".xls",
+        ".xlsx",
+        ".ppt",
+        ".pptx",
+        ".zip",
+        ".tar",
+        ".gz",
+        ".bz2",
+        ".7z",
+        ".rar",
+        ".deb",
+        ".rpm",
+        ".iso",
+        ".dmg",
+        ".pkg",
+        ".msi",
+        ".app",
+    }
+)
+
+
+class _ExtensionKind(Enum):
+    """What a file extension alone says about a file's content."""
+
+    TEXT = "text"
+    BINARY = "binary"
+    UNKNOWN = "unknown"
+
+
+# Both extension sets flattened so classifying is a single lookup
+_EXTENSION_KINDS = {
+    **dict.fromkeys(BINARY_FILE_EXTENSIONS, _ExtensionKind.BINARY),
+    **dict.fromkeys(TEXT_FILE_EXTENSIONS, _ExtensionKind.TEXT),
+}
+
+
+def _classify_extension(path: str) -> _ExtensionKind:
+    """Classify a file by extension, without touching the file."""
+    suffix = os.path.splitext(path)[1].lower()
+    return _EXTENSION_KINDS.get(suffix, _ExtensionKind.UNKNOWN)
+
+
+# Bytes that don't count towards the binary-content threshold: everything
+# except control characters, which still allows tab, newline and carriage return
+_PRINTABLE_BYTES = bytes([9, 10, 13, *range(32, 256)])
+
+# Flags for peeking at file contents. The extra flags are platform specific
+# and are left out where they don't exist (O_BINARY stops Windows from
+# translating line endings).
+_READ_FLAGS = os.O_RDONLY | getattr(os, "O_BINARY", 0) | getattr(os, "O_CLOEXEC", 0)
+_O_NOATIME: int = getattr(os, "O_NOATIME", 0)
+
+# Line prefixes marking comments and markup that make for dull previews
+_COMMENT_PREFIXES = ("#", "//", "/*", "*", "<!")
+
+# Bound on cached previews, which persist for the whole session
+_PREVIEW_CACHE_LIMIT = 256
+
+_K = TypeVar("_K")
+_V = TypeVar("_V")
+
+
+def _cache_put(cache: dict[_K, _V], key: _K, value: _V, limit: int) -> None:
+    """Store a value, evicting the oldest entry once the cache is full."""
+    if len(cache) >= limit:
+        del cache[next(iter(cache))]
+    cache[key] = value
+
+
+@dataclass(frozen=True, slots=True)
+class _ScannedEntry:
+    """A filesystem entry with its type captured once at scan time.
+
+    Paths are kept as plain strings while walking; a ``Path`` is only built
+    for the item that actually becomes a discovery.
+    """
+
+    path: str
+    real_path: str  # Resolved form of path
+    is_dir: bool
+    is_file: bool
+    # Scan result this entry came from, which caches its stat once taken
+    dir_entry: os.DirEntry[str] | None = field(default=None, compare=False)
+
+    @classmethod
+    def from_path(cls, path: str, real_path: str) -> "_ScannedEntry":
+        """Build an entry for a path that didn't come from a directory scan."""
+        return cls(path, real_path, os.path.isdir(path), os.path.isfile(path))
+
+    def stat(self) -> os.stat_result:
+        """Stat the entry, reusing the scan's cached result when there is one."""
+        if self.dir_entry is not None:
+            return self.dir_entry.stat()
+        return os.stat(self.path)
+
+
+class _Reservoir:
+    """Uniform random pick from a stream without holding the whole stream."""
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.chosen: _ScannedEntry | None = None
+
+    def offer(self, item: _ScannedEntry) -> None:
+        """Consider an item, keeping it with probability 1/count."""
+        self.count += 1
+        if random.randrange(self.count) == 0:
+            self.chosen = item
+
+
 class FilesystemExplorer:
     """Safe filesystem exploration that respects directory boundaries."""
 
@@ -31,11 +244,36 @@ class FilesystemExplorer:
         random.seed(time.time_ns())
 
         self.allowed_paths = [Path(d).resolve() for d in allowed_dirs]
-        self.current_path = (
-            random.choice(self.allowed_paths) if self.allowed_paths else None
-        )
+        # Read-only copy for picking restart points without random.choice
+        self._allowed_roots = tuple(self.allowed_paths)
+        self.current_path = self._get_fallback_path()
         self.discoveries_made = 0  # Track discoveries for session limits
-        self.discovered_paths: set[Path] = set()  # Track what we've already found
+        # Track what we've already found, by resolved path string
+        self.discovered_paths: set[str] = set()
+
+        allowed_strs = [str(p) for p in self.allowed_paths]
+        # Resolved paths and safety decisions for the current step only, so a
+        # directory (or allowed root) swapped for a symlink between steps is
+        # resolved again rather than trusted
+        self._resolved_cache: dict[str, str] = {}
+        self._safe_cache: dict[str, bool] = {}
+        # Previews keyed by (resolved path, mtime_ns, size) so edits invalidate
+        # them; locked because wander_batch builds discoveries in threads
+        self._preview_cache: dict[tuple[str, int, int], str | None] = {}
+        self._preview_lock = threading.Lock()
+        # Trailing separator keeps "/foo" from matching "/foobar"
+        self._allowed_prefixes = [
+            s if s.endswith(os.sep) else s + os.sep for s in allowed_strs
+        ]
+        # Sorted outermost prefixes for bisect lookups; nested roots are
+        # dropped since their parent root already covers them
+        self._containment_prefixes: list[str] = []
+        for prefix in sorted(set(self._allowed_prefixes)):
+            if not (
+                self._containment_prefixes
+                and prefix.startswith(self._containment_prefixes[-1])
+            ):
+                self._containment_prefixes.append(prefix)
 
     def wander(self) -> FileSystemDiscovery | None:
         """Pick a random direction to explore and return a discovery.
@@ -48,30 +286,84 @@ class FilesystemExplorer:
             FileSystemDiscovery object if an item is found, None if
             exploration limits reached or no items available.
         """
+        discovered_item = self._step()
+        if discovered_item is None:
+            return None
+        return self._create_discovery(discovered_item)
+
+    def wander_iter(self) -> Iterator[FileSystemDiscovery]:
+        """Keep wandering, yielding discoveries until exploration stops.
+
+        Equivalent to calling ``wander()`` until it returns None, without
+        the per-call dispatch when a caller wants every discovery in turn.
+
+        Yields:
+            FileSystemDiscovery objects in walk order.
+        """
+        step = self._step
+        create_discovery = self._create_discovery
+        while (discovered_item := step()) is not None:
+            yield create_discovery(discovered_item)
+
+    async def wander_batch(self, count: int) -> list[FileSystemDiscovery]:
+        """Make up to ``count`` discoveries, reading file previews concurrently.
+
+        The random walk itself stays sequential since each step starts where
+        the last one ended, but the file reads behind each discovery are
+        independent and run in worker threads.
+
+        Args:
+            count: Maximum number of discoveries to make.
+
+        Returns:
+            Discoveries in walk order; shorter than ``count`` if exploration
+            limits are reached or nothing more is available.
+        """
+        entries = []
+        for _ in range(count):
+            discovered_item = self._step()
+            if discovered_item is None:
+                break
+            entries.append(discovered_item)
+
+        return list(
+            await asyncio.gather(
+                *(asyncio.to_thread(self._create_discovery, e) for e in entries)
+            )
+        )
+
+    def _step(self) -> _ScannedEntry | None:
+        """Take one random-walk step and record the item it lands on."""
         # Early validation - group all precondition checks
         if not self._can_explore():
             return None
 
+        # The filesystem may have changed since the last step
+        self._safe_cache.clear()
+        self._resolved_cache.clear()
+
         # Safe exploration with consistent error handling
         # Try up to 3 times with different starting paths if needed
         for attempt in range(3):
             discovered_item = self._safe_explore()
             if discovered_item:
                 # Process successful discovery
-                return self._process_discovery(discovered_item)
+                self._record_discovery(discovered_item)
+                return discovered_item
 
             # If no discovery, try a different starting path
             if attempt < 2:  # Don't change path on last attempt
-                self.current_path = random.choice(self.allowed_paths)
+                self.current_path = self._random_allowed_path()
 
         return None
 
     def _can_explore(self) -> bool:
         """Check if exploration can proceed."""
         if self.discoveries_made >= MAX_DISCOVERIES_PER_SESSION:
-            logger.debug(
-                f"Discovery limit reached. [limit={MAX_DISCOVERIES_PER_SESSION}]"
-            )
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    f"Discovery limit reached. [limit={MAX_DISCOVERIES_PER_SESSION}]"
+                )
             return False
 
         if not self.allowed_paths or self.current_path is None:
@@ -80,13 +372,16 @@ class FilesystemExplorer:
 
         return True
 
-    def _safe_explore(self) -> Path | None:
+    def _safe_explore(self) -> _ScannedEntry | None:
         """Safely explore current location with error handling."""
         try:
             start_path = self._get_valid_start_path()
             return self._explore_location(start_path)
         except (OSError, PermissionError) as e:
-            logger.debug(f"Exploration error. [path={self.current_path}, error={e}]")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    f"Exploration error. [path={self.current_path}, error={e}]"
+                )
             return None
 
     def _get_valid_start_path(self) -> Path:
@@ -95,151 +390,168 @@ class FilesystemExplorer:
             return self.current_path
 
         # Fallback to random allowed path
-        start_path = random.choice(self.allowed_paths)
+        start_path = self._random_allowed_path()
         self.current_path = start_path
         return start_path
 
-    def _process_discovery(self, discovered_item: Path) -> FileSystemDiscovery:
-        """Process a successful discovery."""
+    def _record_discovery(self, discovered_item: _ScannedEntry) -> None:
+        """Record a successful discovery and move the walk on from it."""
         # Mark this path as discovered to avoid repetition
-        self.discovered_paths.add(discovered_item.resolve())
+        self.discovered_paths.add(discovered_item.real_path)
         self.discoveries_made += 1
-        discovery = self._create_discovery(discovered_item)
         self._update_current_path(discovered_item)
 
-        logger.debug(
-            f"Discovery made. [name={discovery.name}, "
-            f"type={discovery.discovery_type}, path={discovery.path}]"
-        )
-        return discovery
-
-    def _explore_location(self, location: Path) -> Path | None:
+    def _explore_location(self, location: Path) -> _ScannedEntry | None:
         """Explore a location and randomly select an item to discover.
 
         Args:
             location: Path to explore (file or directory)
 
         Returns:
-            Path of discovered item, or None if nothing found or accessible.
+            Entry for the discovered item, or None if nothing found or accessible.
         """
         if not self._is_safe_path(location):
             return None
 
-        if location.is_file():
-            return location
+        path = str(location)
+        entry = _ScannedEntry.from_path(path, self._resolve_cached(path))
+        if entry.is_file:
+            return entry
 
-        if location.is_dir():
-            return self._explore_directory(location)
+        if entry.is_dir:
+            return self._explore_directory(entry)
 
         return None
 
-    def _explore_directory(self, directory: Path) -> Path | None:
-        """Explore a directory and return a random item or the directory itself."""
-        # Try to get directory contents, fallback to directory itself if fails
-        items = self._get_directory_items(directory)
-        if items is None:
-            return directory  # Can't read directory, return it as discovery
+    def _explore_directory(self, directory: _ScannedEntry) -> _ScannedEntry:
+        """Explore a directory and return a random item or the directory itself.
 
-        # Handle empty directory
-        if not items:
-            return directory
+        Entries are streamed from ``os.scandir`` and picked by reservoir
+        sampling, so memory stays constant however large the directory is.
+        """
+        # One roll drives both coin flips below. Drawn before listing so a
+        # directory result doesn't need the directory to be read at all.
+        roll = random.random()
 
-        # Filter to safe and depth-compliant items
-        safe_items = self._filter_safe_items(items)
-        if not safe_items:
+        # Random selection: 30% chance to return directory, 70% to explore contents
+        if roll < 0.3:
             return directory
 
-        # Prefer undiscovered items, but don't completely exclude discovered ones
-        undiscovered_items = self._filter_undiscovered_items(safe_items)
-
         # If we have undiscovered items, strongly prefer them (80% chance)
-        # but allow some rediscovery for continued exploration (20% chance)
-        use_undiscovered = undiscovered_items and (
-            not safe_items or random.random() < 0.8
-        )
+        # but allow some rediscovery for continued exploration (20% chance).
+        # Given roll >= 0.3, roll < 0.86 has probability 0.56 / 0.7 = 0.8.
+        prefer_undiscovered = roll < 0.3 + 0.7 * 0.8
 
-        items_to_explore = undiscovered_items if use_undiscovered else safe_items
-        if not items_to_explore:
+        # Depth is worked out once here; children are one level deeper
+        dir_depth = self._depth_of(directory.real_path)
+        if dir_depth is None:
             return directory
 
-        # Prefer files that meet our content criteria from the items we're exploring
-        preferred_items = self._filter_preferred_files(items_to_explore)
-
-        # Random selection: 30% chance to return directory, 70% to explore contents
-        if random.random() < 0.3:
-            return directory
+        safe, safe_preferred = _Reservoir(), _Reservoir()
+        fresh, fresh_preferred = _Reservoir(), _Reservoir()
+        try:
+            with os.scandir(directory.path) as it:
+                for dir_entry in it:
+                    is_dir = dir_entry.is_dir()
+                    if dir_entry.is_symlink():
+                        # Links can point anywhere, so check them in full
+                        entry = _ScannedEntry(
+                            dir_entry.path,
+                            self._resolve_cached(dir_entry.path),
+                            is_dir,
+                            dir_entry.is_file(),
+                            dir_entry,
+                        )
+                        if not self._is_safe_item(entry):
+                            continue
+                    else:
+                        # Plain children of a safe directory are safe; only the
+                        # depth needs checking (files don't add a level)
+                        if dir_depth + is_dir > MAX_EXPLORATION_DEPTH:
+                            continue
+                        entry = _ScannedEntry(
+                            dir_entry.path,
+                            os.path.join(directory.real_path, dir_entry.name),
+                            is_dir,
+                            dir_entry.is_file(),
+                            dir_entry,
+                        )
+
+                    if prefer_undiscovered and self._is_undiscovered(entry):
+                        pool, preferred_pool = fresh, fresh_preferred
+                    elif not fresh.count:
+                        # Only needed while no undiscovered item has turned up
+                        pool, preferred_pool = safe, safe_preferred
+                    else:
+                        continue
+
+                    pool.offer(entry)
+                    # Prefer files that meet our content criteria
+                    if self._is_preferred_item(entry):
+                        preferred_pool.offer(entry)
+        except (OSError, PermissionError):
+            pass  # Can't read (the rest of) the directory, use what we have
 
+        pool, preferred_pool = (
+            (fresh, fresh_preferred) if fresh.count else (safe, safe_preferred)
+        )
         # Use preferred items if available, fallback to all items being explored
-        candidates = preferred_items if preferred_items else items_to_explore
-        return random.choice(candidates)
+        return preferred_pool.chosen or pool.chosen or directory
+
+    def _is_safe_item(self, item: _ScannedEntry) -> bool:
+        """Check an entry is safe and depth-compliant."""
+        # A path has a depth exactly when it's inside an allowed directory,
+        # so one resolve and prefix pass answers both questions
+        return self._is_within_depth_limit(item.path, is_file=item.is_file)
+
+    def _is_preferred_item(self, item: _ScannedEntry) -> bool:
+        """Check whether an entry has good content for dreams."""
+        # Always include directories
+        if item.is_dir:
+            return True
+
+        # Extension check is free, so rule out non-text files before any stat.
+        # Content is only sniffed once a file is chosen and previewed.
+        if not item.is_file or not self._is_text_file(item.path):
+            return False
 
-    def _get_directory_items(self, directory: Path) -> list[Path] | None:
-        """Get directory contents, return None if inaccessible."""
         try:
-            return list(directory.iterdir())
+            size = item.stat().st_size
         except (OSError, PermissionError):
-            return None
+            return False  # Skip files we can't analyze
 
-    def _filter_safe_items(self, items: list[Path]) -> list[Path]:
-        """Filter items to only include safe and depth-compliant paths."""
-        return [
-            item
-            for item in items
-            if self._is_safe_path(item) and self._is_within_depth_limit(item)
-        ]
+        # Prefer files that are large enough to have meaningful content
+        # but not too large to process efficiently
+        return MIN_FILE_SIZE_BYTES <= size <= MAX_FILE_SIZE_FOR_PREVIEW
+
+    def _is_undiscovered(self, item: _ScannedEntry) -> bool:
+        """Check an entry hasn't already been discovered."""
+        return item.real_path not in self.discovered_paths
 
-    def _filter_preferred_files(self, items: list[Path]) -> list[Path]:
-        """Filter files to prefer those with good content for dreams."""
-        preferred = []
-        for item in items:
-            # Always include directories
-            if item.is_dir():
-                preferred.append(item)
-                continue
-
-            # For files, check if they meet our preferred criteria
-            if item.is_file():
-                try:
-                    stat = item.stat()
-                    size = stat.st_size
-
-                    # Prefer files that are large enough to have meaningful content
-                    # but not too large to process efficiently
-                    if (
-                        size >= MIN_FILE_SIZE_BYTES
-                        and size <= MAX_FILE_SIZE_FOR_PREVIEW
-                        and self._is_text_file(item)
-                        and not self._is_binary_file(item)
-                    ):
-                        preferred.append(item)
-                except (OSError, PermissionError):
-                    pass  # Skip files we can't analyze
-
-        return preferred
-
-    def _filter_undiscovered_items(self, items: list[Path]) -> list[Path]:
-        """Filter out items that have already been discovered."""
-        return [item for item in items if item.resolve() not in self.discovered_paths]
-
-    def _update_current_path(self, discovered_item: Path) -> None:
+    def _update_current_path(self, discovered_item: _ScannedEntry) -> None:
         """Update current path for next exploration (random walk behavior).
 
         Args:
-            discovered_item: The path that was just discovered.
+            discovered_item: The entry that was just discovered.
         """
         new_path = self._determine_next_path(discovered_item)
         self.current_path = new_path or self._get_fallback_path()
 
-    def _determine_next_path(self, discovered_item: Path) -> Path | None:
+    def _determine_next_path(self, discovered_item: _ScannedEntry) -> Path | None:
         """Determine the next path based on discovered item type."""
         try:
-            if discovered_item.is_dir() and self._is_safe_path(discovered_item):
-                return discovered_item
-
-            if discovered_item.is_file():
-                parent = discovered_item.parent
+            path = discovered_item.path
+            if discovered_item.is_dir:
+                # The scan already worked out where this directory resolves
+                # to; recording it spares this check from resolving it again
+                self._resolved_cache.setdefault(path, discovered_item.real_path)
+                if self._is_safe_path(path):
+                    return Path(path)
+
+            if discovered_item.is_file:
+                parent = os.path.dirname(path)
                 if self._is_safe_path(parent):
-                    return parent
+                    return Path(parent)
 
         except (OSError, AttributeError):
             pass
@@ -248,81 +560,136 @@ class FilesystemExplorer:
 
     def _get_fallback_path(self) -> Path | None:
         """Get a fallback path when path determination fails."""
-        return random.choice(self.allowed_paths) if self.allowed_paths else None
-
-    def _is_within_depth_limit(self, path: Path) -> bool:
+        return self._random_allowed_path() if self._allowed_roots else None
+
+    def _random_allowed_path(self) -> Path:
+        """Pick a random allowed directory; there must be at least one."""
+        roots = self._allowed_roots
+        if len(roots) == 1:
+            return roots[0]
+        return roots[random.randrange(len(roots))]
+
+    def _is_within_depth_limit(
+        self, path: str | Path, is_file: bool | None = None
+    ) -> bool:
         """Check if path is within the maximum exploration depth.
 
         Args:
             path: Path to check for depth compliance.
+            is_file: Known file type of path, if already available from a scan.
 
         Returns:
             True if path is within MAX_EXPLORATION_DEPTH, False otherwise.
         """
         try:
-            resolved_path = path.resolve()
+            depth = self._depth_of(self._resolve_cached(path))
         except (OSError, ValueError):
             return False
 
-        # Check depth relative to each allowed path
-        for allowed_path in self.allowed_paths:
-            depth = self._calculate_depth(resolved_path, allowed_path, path.is_file())
-            if depth is not None and depth <= MAX_EXPLORATION_DEPTH:
-                return True
+        if depth is None:
+            return False
 
-        return False
+        # For files, subtract 1 since the file itself doesn't count as depth
+        if is_file is None:
+            is_file = os.path.isfile(path)
+        if is_file:
+            depth -= 1
+        return depth <= MAX_EXPLORATION_DEPTH
 
-    def _calculate_depth(
-        self, resolved_path: Path, allowed_path: Path, is_file: bool
-    ) -> int | None:
-        """Calculate depth of path relative to allowed path."""
-        try:
-            relative_path = resolved_path.relative_to(allowed_path)
-            depth = len(relative_path.parts)
-            # For files, subtract 1 since the file itself doesn't count as depth
-            return depth - 1 if is_file else depth
-        except ValueError:
-            # Path is not relative to this allowed_path
-            return None
+    def _depth_of(self, resolved: str) -> int | None:
+        """Get the depth of a resolved path below its closest allowed root.
 
-    def _is_safe_path(self, path: Path) -> bool:
+        Returns:
+            Number of levels below the allowed root, or None if the path
+            isn't inside any allowed directory.
+        """
+        resolved = resolved.rstrip(os.sep) + os.sep
+        # Depth is the number of separators left after the allowed prefix
+        return min(
+            (
+                resolved.count(os.sep, len(prefix))
+                for prefix in self._allowed_prefixes
+                if resolved.startswith(prefix)
+            ),
+            default=None,
+        )
+
+    def _is_safe_path(self, path: str | Path) -> bool:
         """Validate path is within allowed directories."""
+        key = os.fspath(path)
+        cached = self._safe_cache.get(key)
+        if cached is not None:
+            return cached
+
         try:
-            resolved = path.resolve()
-            return any(
-                resolved.is_relative_to(allowed) for allowed in self.allowed_paths
-            )
+            resolved = self._resolve_cached(key).rstrip(os.sep) + os.sep
         except (OSError, ValueError):
             return False
 
-    def _create_discovery(self, path: Path) -> FileSystemDiscovery:
+        # With no nested prefixes, the only candidate is the closest one below
+        i = bisect.bisect_right(self._containment_prefixes, resolved) - 1
+        is_safe = i >= 0 and resolved.startswith(self._containment_prefixes[i])
+        self._safe_cache[key] = is_safe
+        return is_safe
+
+    def _resolve_cached(self, path: str | Path) -> str:
+        """Resolve a path, reusing the resolved parent when possible.
+
+        Children of an already-resolved directory only need a single lstat
+        (to rule out symlinks) instead of a full ``realpath()`` walk.
+        """
+        path = os.fspath(path)
+        cached = self._resolved_cache.get(path)
+        if cached is not None:
+            return cached
+
+        parent, name = os.path.split(path)
+        resolved_parent = self._resolved_cache.get(parent)
+        if (
+            resolved_parent is not None
+            and name not in ("", ".", "..")
+            and not os.path.islink(path)
+        ):
+            resolved = os.path.join(resolved_parent, name)
+        else:
+            resolved = os.path.realpath(path)
+
+        self._resolved_cache[path] = resolved
+        return resolved
+
+    def _create_discovery(self, entry: _ScannedEntry) -> FileSystemDiscovery:
         """Create discovery object for a filesystem item."""
-        # TODO: Implement discovery creation with proper metadata
+        path = Path(entry.path)
         discovery_type = (
-            DiscoveryType.FILE.value
-            if path.is_file()
-            else DiscoveryType.DIRECTORY.value
+            DiscoveryType.FILE.value if entry.is_file else DiscoveryType.DIRECTORY.value
         )
         size_bytes = None
         preview = None
 
-        if path.is_file():
+        if entry.is_file:
             try:
-                stat = path.stat()
+                stat = entry.stat()
                 size_bytes = stat.st_size
 
                 # Generate preview for reasonable-sized text files
                 # Skip only extremely large files, keep small files for compatibility
-                if (
-                    size_bytes <= MAX_FILE_SIZE_FOR_PREVIEW
-                    and self._is_text_file(path)
-                    and not self._is_binary_file(path)
+                if size_bytes <= MAX_FILE_SIZE_FOR_PREVIEW and self._is_text_file(
+                    entry.path
                 ):
-                    preview = self._generate_preview(path)
+                    key = (entry.real_path, stat.st_mtime_ns, size_bytes)
+                    with self._preview_lock:
+                        cached = key in self._preview_cache
+                        preview = self._preview_cache.get(key)
+                    if not cached:
+                        preview = self._read_preview(entry.path, size_bytes)
+                        with self._preview_lock:
+                            _cache_put(
+                                self._preview_cache, key, preview, _PREVIEW_CACHE_LIMIT
+                            )
             except (OSError, PermissionError):
                 pass  # Skip files we can't read
 
-        return FileSystemDiscovery(
+        discovery = FileSystemDiscovery(
             path=path,
             name=path.name,
             discovery_type=discovery_type,
@@ -330,175 +697,82 @@ class FilesystemExplorer:
             preview=preview,
         )
 
-    def _is_text_file(self, path: Path) -> bool:
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                f"Discovery made. [name={discovery.name}, "
+                f"type={discovery.discovery_type}, path={discovery.path}]"
+            )
+        return discovery
+
+    def _read_preview(self, path: str, size_bytes: int) -> str | None:
+        """Read the head of a text file and build its preview."""
+        # One bounded read serves both the binary sniff and the preview
+        head = self._read_head(path, min(size_bytes, MAX_FILE_PREVIEW_SIZE_BYTES))
+        if self._is_binary_content(head):
+            return None
+        return self._generate_preview(head)
+
+    def _is_text_file(self, path: str) -> bool:
         """Check if file appears to be a text file based on extension."""
-        text_extensions = {
-            ".txt",
-            ".md",
-            ".py",
-            ".js",
-            ".json",
-            ".xml",
-            ".html",
-            ".css",
-            ".yml",
-            ".yaml",
-            ".toml",
-            ".ini",
-            ".cfg",
-            ".conf",
-            ".log",
-            ".sh",
-            ".bash",
-            ".zsh",
-            ".fish",
-            ".ps1",
-            ".bat",
-            ".cmd",
-            ".sql",
-            ".rs",
-            ".go",
-            ".java",
-            ".cpp",
-            ".c",
-            ".h",
-            ".hpp",
-            ".php",
-            ".rb",
-            ".pl",
-            ".lua",
-            ".r",
-            ".scala",
-            ".kt",
-            ".swift",
-            ".ts",
-            ".jsx",
-            ".tsx",
-            ".vue",
-            ".svelte",
-            ".cs",
-            ".vb",
-            ".fs",
-            ".clj",
-            ".lisp",
-            ".scm",
-            ".hs",
-            ".elm",
-            ".ex",
-            ".exs",
-            ".erl",
-            ".dart",
-            ".groovy",
-            ".kts",
-            ".gradle",
-            ".sbt",
-            ".dockerfile",
-        }
-        return path.suffix.lower() in text_extensions
-
-    def _is_binary_file(self, path: Path) -> bool:
-        """Check if file appears to be binary by reading a small sample."""
-        if not path.is_file():
-            return False
+        return _classify_extension(path) is _ExtensionKind.TEXT
 
-        # Common binary extensions
-        binary_extensions = {
-            ".exe",
-            ".dll",
-            ".so",
-            ".dylib",
-            ".bin",
-            ".o",
-            ".obj",
-            ".jpg",
-            ".jpeg",
-            ".png",
-            ".gif",
-            ".bmp",
-            ".tiff",
-            ".webp",
-            ".mp3",
-            ".mp4",
-            ".wav",
-            ".flac",
-            ".avi",
-            ".mov",
-            ".mkv",
-            ".pdf",
-            ".doc",
-            ".docx",
-            ".xls",
-            ".xlsx",
-            ".ppt",
-            ".pptx",
-            ".zip",
-            ".tar",
-            ".gz",
-            ".bz2",
-            ".7z",
-            ".rar",
-            ".deb",
-            ".rpm",
-            ".iso",
-            ".dmg",
-            ".pkg",
-            ".msi",
-            ".app",
-        }
-
-        if path.suffix.lower() in binary_extensions:
-            return True
+    def _read_head(self, path: str, size: int) -> bytes:
+        """Read up to ``size`` bytes from the start of a file.
 
-        # Check for binary content by reading first few bytes
+        Avoids bumping the file's access time where the platform allows it,
+        so wandering doesn't look like use to backup or cleanup tools.
+        """
         try:
-            with path.open("rb") as f:
-                chunk = f.read(512)  # Read first 512 bytes
-                # If more than 30% of bytes are non-printable, consider it binary
-                if len(chunk) == 0:
-                    return False
-                # Count non-printable bytes (excluding tab, newline, carriage return)
-                non_printable = sum(
-                    1 for byte in chunk if byte < 32 and byte not in (9, 10, 13)
-                )
-                return (non_printable / len(chunk)) > 0.30
-        except (OSError, PermissionError):
-            return True  # If we can't read it, treat as binary
-
-    def _generate_preview(self, path: Path) -> str | None:
-        """Generate a rich preview of file content with better extraction."""
+            fd = os.open(path, _READ_FLAGS | _O_NOATIME)
+        except PermissionError:
+            # O_NOATIME is only allowed on files we own
+            if not _O_NOATIME:
+                raise
+            fd = os.open(path, _READ_FLAGS)
         try:
-            with path.open("r", encoding="utf-8", errors="ignore") as f:
-                content = f.read(MAX_FILE_PREVIEW_SIZE_BYTES)
+            return os.read(fd, size)
+        finally:
+            os.close(fd)
+
+    def _is_binary_content(self, data: bytes) -> bool:
+        """Check if a leading chunk of file content looks binary."""
+        chunk = data[:512]
+        # If more than 30% of bytes are non-printable, consider it binary
+        if len(chunk) == 0:
+            return False
+        # Count non-printable bytes (excluding tab, newline, carriage return)
+        non_printable = len(chunk.translate(None, _PRINTABLE_BYTES))
+        return (non_printable / len(chunk)) > 0.30
 
-                if not content.strip():
-                    return None
+    def _generate_preview(self, data: bytes) -> str | None:
+        """Generate a rich preview of file content with better extraction."""
+        content = data.decode("utf-8", errors="ignore").strip()
 
-                # Clean and process content
-                content = content.strip()
-                lines = content.split("\n")
+        if not content:
+            return None
 
-                # Filter out empty lines and comments for more meaningful content
-                meaningful_lines = []
-                for line in lines:
-                    line = line.strip()
-                    if line and not line.startswith(("#", "//", "/*", "*", "<!")):
-                        meaningful_lines.append(line)
+        # Clean and process content
+        lines = content.splitlines()
 
-                # If we filtered out too much, fall back to original lines
-                if not meaningful_lines:
-                    meaningful_lines = [
-                        line.strip() for line in lines[:5] if line.strip()
-                    ]
+        # Filter out empty lines and comments for more meaningful content,
+        # stopping as soon as there are enough for the preview
+        meaningful = (
+            line
+            for line in map(str.strip, lines)
+            if line and not line.startswith(_COMMENT_PREFIXES)
+        )
+        meaningful_lines = list(islice(meaningful, 5))
 
-                # Take up to 5 meaningful lines or the first 300 characters
-                preview_lines = meaningful_lines[:5]
-                preview = "\n".join(preview_lines)
+        # If we filtered out too much, fall back to original lines
+        if not meaningful_lines:
+            meaningful_lines = [line.strip() for line in lines[:5] if line.strip()]
 
-                # Truncate if too long but try to keep complete words
-                if len(preview) > 300:
-                    preview = preview[:297] + "..."
+        # Take up to 5 meaningful lines or the first 300 characters
+        preview_lines = meaningful_lines[:5]
+        preview = "\n".join(preview_lines)
 
-                return preview if preview else None
+        # Truncate if too long but try to keep complete words
+        if len(preview) > 300:
+            preview = preview[:297] + "..."
 
-        except (OSError, UnicodeDecodeError):
-            return None
+        return preview if preview else None
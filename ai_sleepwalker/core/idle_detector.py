@@ -1,8 +1,8 @@
 """User activity detection for triggering sleepwalker sessions."""
 
 import logging
-import threading
-from datetime import datetime
+import time
+from datetime import datetime, timedelta
 from typing import Any
 
 from pynput import keyboard, mouse
@@ -10,6 +10,10 @@ from pynput import keyboard, mouse
 # Module-level logger for configurable debug messages
 logger = logging.getLogger(__name__)
 
+# Mouse moves arrive hundreds of times a second; recording one per interval
+# is plenty against idle thresholds measured in minutes
+MOUSE_MOVE_SAMPLE_INTERVAL = 1.0
+
 
 class IdleDetector:
     """Detects when the system has been idle for a configurable period."""
@@ -22,8 +26,9 @@ class IdleDetector:
             start_listeners: Whether to start pynput listeners (default: True)
         """
         self.idle_threshold = idle_threshold
-        self.last_activity = datetime.now()
-        self._activity_lock = threading.Lock()
+        # Monotonic clock reading of the last activity. A single float store
+        # is atomic, so input callbacks can update it without a lock.
+        self._last_activity_tick = time.monotonic()
         self._mouse_listener: mouse.Listener | None = None
         self._keyboard_listener: keyboard.Listener | None = None
 
@@ -39,7 +44,7 @@ class IdleDetector:
         """Set up and start pynput listeners."""
         # Set up pynput listeners for mouse and keyboard activity
         self._mouse_listener = mouse.Listener(
-            on_move=self._on_activity,
+            on_move=self._on_move,
             on_click=self._on_activity,
             on_scroll=self._on_activity,
         )
@@ -51,12 +56,22 @@ class IdleDetector:
         self._mouse_listener.start()
         self._keyboard_listener.start()
 
+    @property
+    def last_activity(self) -> datetime:
+        """Wall-clock time of the last detected activity."""
+        elapsed = time.monotonic() - self._last_activity_tick
+        return datetime.now() - timedelta(seconds=elapsed)
+
+    @last_activity.setter
+    def last_activity(self, value: datetime) -> None:
+        elapsed = (datetime.now() - value).total_seconds()
+        self._last_activity_tick = time.monotonic() - elapsed
+
     @property
     def is_idle(self) -> bool:
         """Check if system has been idle long enough."""
-        with self._activity_lock:
-            elapsed = (datetime.now() - self.last_activity).total_seconds()
-            return elapsed >= self.idle_threshold
+        elapsed = time.monotonic() - self._last_activity_tick
+        return elapsed >= self.idle_threshold
 
     def stop(self) -> None:
         """Stop pynput listeners for clean shutdown."""
@@ -68,8 +83,15 @@ class IdleDetector:
             self._keyboard_listener = None
         logger.debug("IdleDetector stopped")
 
+    def _on_move(self, *args: Any, **kwargs: Any) -> None:
+        """Called on mouse movement; records at most one activity per interval."""
+        if time.monotonic() - self._last_activity_tick < MOUSE_MOVE_SAMPLE_INTERVAL:
+            return
+        self._on_activity(*args, **kwargs)
+
     def _on_activity(self, *args: Any, **kwargs: Any) -> None:
         """Called when user activity is detected."""
-        with self._activity_lock:
-            self.last_activity = datetime.now()
-        logger.debug(f"Activity detected. [timestamp={self.last_activity}]")
+        self._last_activity_tick = time.monotonic()
+        # Runs on every input event, so skip building the message unless needed
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Activity detected. [timestamp={self.last_activity}]")
@@ -1,21 +1,44 @@
 """LLM client for dream generation."""
 
+import asyncio
+import contextlib
+import hashlib
 import logging
+import os
+import tempfile
 import time
 from dataclasses import dataclass
 from datetime import datetime
-
-import litellm
-from tenacity import retry, stop_after_attempt, wait_exponential
+from functools import lru_cache
+from pathlib import Path
+from types import ModuleType
+from typing import Any
 
 from ..experiences.base import ExperienceResult, ExperienceType, Observation
-from .prompts import format_dream_prompt
-
-# Suppress verbose LiteLLM logging
-litellm.suppress_debug_info = True
+from .prompts import DREAM_PROMPT_PREFIX, format_dream_prompt
 
 logger = logging.getLogger(__name__)
 
+# Model routes served by Anthropic, which only cache prompt prefixes that are
+# explicitly marked with a cache_control breakpoint
+ANTHROPIC_MODEL_PREFIXES = ("anthropic/", "bedrock/anthropic", "claude-")
+
+
+@lru_cache(maxsize=1)
+def _load_litellm() -> ModuleType:
+    """Import and configure litellm on first use.
+
+    litellm takes a noticeable fraction of a second to import, which
+    commands that never generate a dream shouldn't pay for.
+    """
+    import litellm
+
+    # Suppress verbose LiteLLM logging
+    litellm.suppress_debug_info = True
+    # Disable aiohttp transport to avoid unclosed session warnings
+    litellm.disable_aiohttp_transport = True
+    return litellm
+
 
 class LLMError(Exception):
     """Base exception for LLM-related errors."""
@@ -44,6 +67,15 @@ class LLMConfig:
     max_tokens: int | None = None
     temperature: float | None = None
     fallback_models: list[str] | None = None
+    # Retries per model for transient errors (rate limits, 5xx, dropped
+    # connections), done by the provider SDK with jittered backoff
+    num_retries: int = 2
+    # Opt-in on-disk cache of responses, keyed on model and prompt
+    cache_dir: Path | None = None
+    cache_ttl_seconds: int = 3600
+    # Start the next fallback model if no answer arrives within this many
+    # seconds, racing it against the slow one; None tries models one by one
+    hedge_delay_seconds: float | None = None
 
     def __post_init__(self) -> None:
         """Set up fallback models if not provided."""
@@ -56,34 +88,91 @@ class LLMClient:
 
     def __init__(self, config: LLMConfig | None = None):
         self.config = config or LLMConfig()
-        self._models_to_try = [self.config.model] + (self.config.fallback_models or [])
-        # Disable aiohttp transport to avoid unclosed session warnings
-        litellm.disable_aiohttp_transport = True
+        self._models_to_try: tuple[str, ...] = (
+            self.config.model,
+            *(self.config.fallback_models or ()),
+        )
 
     async def generate_dream(self, observations: list[Observation]) -> ExperienceResult:
         """Generate dream narrative from observations with fallback models."""
-        start_time = time.time()
+        if not observations:
+            # Nothing to dream about, so don't pay for a round trip
+            now = datetime.now()
+            return ExperienceResult(
+                experience_type=ExperienceType.DREAM,
+                session_start=now,
+                session_end=now,
+                total_observations=0,
+                content="",
+                metadata={"observation_count": 0, "skipped": "no_observations"},
+                file_extension=".md",
+            )
+
+        start_time = time.monotonic()
         prompt = format_dream_prompt(observations)
 
-        last_error = None
+        # An identical prompt seen recently needs no network round trip. The
+        # cache is opt-in, so skip the thread hops entirely when it's off.
+        if self.config.cache_dir is not None:
+            for model in self._models_to_try:
+                cached = await asyncio.to_thread(
+                    self._load_cached_response, model, prompt
+                )
+                if cached is not None:
+                    logger.debug(f"Dream served from response cache. [model={model}]")
+                    return self._build_result(
+                        model, prompt, cached, observations, start_time, cached=True
+                    )
+
+        last_error: Exception | None = None
         models_attempted = []
+        models = iter(self._models_to_try)
+        running: dict[asyncio.Task[ExperienceResult], str] = {}
+
+        def start_next_model() -> None:
+            model = next(models, None)
+            if model is None:
+                return
+            logger.debug(f"Attempting dream generation with model: {model}")
+            task = asyncio.create_task(
+                self._call_model(model, prompt, observations, start_time)
+            )
+            running[task] = model
 
-        for model in self._models_to_try:
-            try:
-                logger.debug(f"Attempting dream generation with model: {model}")
-                result = await self._try_model_with_retry(
-                    model, prompt, observations, start_time
-                )
-                logger.debug(
-                    f"Dream generation successful with {model}. "
-                    f"Duration: {result.metadata['duration_seconds']:.2f}s"
+        start_next_model()
+        try:
+            while running:
+                # Without a hedge delay this waits for each model in turn
+                done, _ = await asyncio.wait(
+                    running,
+                    timeout=self.config.hedge_delay_seconds,
+                    return_when=asyncio.FIRST_COMPLETED,
                 )
-                return result
-            except Exception as e:
-                last_error = e
-                models_attempted.append(model)
-                logger.debug(f"Model {model} failed: {e}")
-                continue
+                if not done:
+                    # Slow rather than failed: race the next model against it
+                    start_next_model()
+                    continue
+
+                for task in done:
+                    model = running.pop(task)
+                    try:
+                        result = task.result()
+                    except Exception as e:
+                        last_error = e
+                        models_attempted.append(model)
+                        logger.debug(f"Model {model} failed: {e}")
+                        start_next_model()
+                        continue
+
+                    logger.debug(
+                        f"Dream generation successful with {model}. "
+                        f"Duration: {result.metadata['duration_seconds']:.2f}s"
+                    )
+                    return result
+        finally:
+            # Stop any models still racing the winner
+            for task in running:
+                task.cancel()
 
         # All models failed
         error_msg = (
@@ -93,22 +182,46 @@ class LLMClient:
         logger.error(error_msg)
         raise LLMAPIError(error_msg) from last_error
 
-    @retry(
-        stop=stop_after_attempt(2), wait=wait_exponential(multiplier=1, min=2, max=5)
-    )
-    async def _try_model_with_retry(
+    async def generate_dreams_batch(
+        self, batches: list[list[Observation]], max_concurrency: int = 8
+    ) -> list[ExperienceResult]:
+        """Generate one dream per batch of observations, several at a time.
+
+        Args:
+            batches: Independent observation sets, e.g. sessions to backfill.
+            max_concurrency: Most dream requests in flight at once.
+
+        Returns:
+            Results in the same order as ``batches``.
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def generate(observations: list[Observation]) -> ExperienceResult:
+            async with semaphore:
+                return await self.generate_dream(observations)
+
+        return list(await asyncio.gather(*(generate(b) for b in batches)))
+
+    async def _call_model(
         self,
         model: str,
         prompt: str,
         observations: list[Observation],
         start_time: float,
     ) -> ExperienceResult:
-        """Try specific model with retry logic."""
+        """Request a dream from one model and validate the response.
+
+        Transient API errors are retried inside litellm (``num_retries``);
+        falling back to other models is up to the caller.
+        """
         # Build completion params with only non-None values
         params = {
             "model": model,
-            "messages": [{"role": "user", "content": prompt}],
+            "messages": [
+                {"role": "user", "content": self._message_content(model, prompt)}
+            ],
             "timeout": self.config.timeout,
+            "num_retries": self.config.num_retries,
         }
 
         # Add optional params only if configured
@@ -118,7 +231,7 @@ class LLMClient:
             params["temperature"] = self.config.temperature
 
         try:
-            response = await litellm.acompletion(**params)
+            response = await _load_litellm().acompletion(**params)
         except Exception as e:
             raise LLMAPIError(f"API call failed for model {model}: {e}") from e
 
@@ -126,35 +239,156 @@ class LLMClient:
         if not response.choices or not response.choices[0].message.content:
             raise LLMValidationError(f"Empty response from model {model}")
 
-        duration = time.time() - start_time
         content = response.choices[0].message.content.strip()
+        if self.config.cache_dir is not None:
+            await asyncio.to_thread(self._store_cached_response, model, prompt, content)
 
-        # Enhanced metadata with observability
-        now = datetime.now()
-        metadata = {
-            "model": model,
-            "duration_seconds": duration,
-            "observation_count": len(observations),
-            "prompt_length": len(prompt),
-            "content_length": len(content),
-        }
+        result = self._build_result(model, prompt, content, observations, start_time)
 
         # Add token usage if available
         if hasattr(response, "usage") and response.usage:
-            metadata.update(
+            result.metadata.update(
                 {
                     "total_tokens": response.usage.total_tokens,
                     "prompt_tokens": response.usage.prompt_tokens,
                     "completion_tokens": response.usage.completion_tokens,
                 }
             )
+            result.metadata.update(self._prompt_cache_usage(response.usage))
+
+        return result
+
+    def _prompt_cache_usage(self, usage: Any) -> dict[str, int]:
+        """Pull provider prompt-cache token counts out of response usage.
+
+        OpenAI-style providers report cached_tokens under
+        prompt_tokens_details; Anthropic reports cache writes and reads
+        separately. Counts a provider doesn't report are left out.
+        """
+        details = getattr(usage, "prompt_tokens_details", None)
+        counts = {
+            "cached_tokens": getattr(details, "cached_tokens", None),
+            "cache_creation_input_tokens": getattr(
+                usage, "cache_creation_input_tokens", None
+            ),
+            "cache_read_input_tokens": getattr(usage, "cache_read_input_tokens", None),
+        }
+        cache_usage = {k: v for k, v in counts.items() if isinstance(v, int)}
+
+        prompt_tokens = getattr(usage, "prompt_tokens", None)
+        cached = cache_usage.get("cached_tokens", 0) or cache_usage.get(
+            "cache_read_input_tokens", 0
+        )
+        if isinstance(prompt_tokens, int) and prompt_tokens > 0:
+            logger.debug(
+                f"Prompt cache usage. [cached_tokens={cached}, "
+                f"prompt_tokens={prompt_tokens}, "
+                f"cache_hit_rate={cached / prompt_tokens:.2f}]"
+            )
+        return cache_usage
+
+    def _build_result(
+        self,
+        model: str,
+        prompt: str,
+        content: str,
+        observations: list[Observation],
+        start_time: float,
+        cached: bool = False,
+    ) -> ExperienceResult:
+        """Wrap generated dream content in an experience result."""
+        # Enhanced metadata with observability
+        metadata: dict[str, Any] = {
+            "model": model,
+            "duration_seconds": time.monotonic() - start_time,
+            "observation_count": len(observations),
+            "prompt_length": len(prompt),
+            "content_length": len(content),
+        }
+        if cached:
+            metadata["cached"] = True
 
+        # generate_dream returns early for empty observations, so there is
+        # always a first and last one here
         return ExperienceResult(
             experience_type=ExperienceType.DREAM,
-            session_start=observations[0].timestamp if observations else now,
-            session_end=observations[-1].timestamp if observations else now,
+            session_start=observations[0].timestamp,
+            session_end=observations[-1].timestamp,
             total_observations=len(observations),
             content=content,
             metadata=metadata,
             file_extension=".md",
         )
+
+    def _message_content(self, model: str, prompt: str) -> str | list[dict[str, Any]]:
+        """Build the user message content for a model.
+
+        Anthropic routes get the static prompt prefix as its own block with a
+        cache breakpoint; other providers cache prompt prefixes implicitly
+        and take the plain string.
+        """
+        is_anthropic = model.startswith(ANTHROPIC_MODEL_PREFIXES)
+        if not (is_anthropic and prompt.startswith(DREAM_PROMPT_PREFIX)):
+            return prompt
+
+        return [
+            {
+                "type": "text",
+                "text": DREAM_PROMPT_PREFIX,
+                "cache_control": {"type": "ephemeral"},
+            },
+            {"type": "text", "text": prompt[len(DREAM_PROMPT_PREFIX) :]},
+        ]
+
+    def _cache_path(self, model: str, prompt: str) -> Path | None:
+        """Get the response cache file for a model and prompt, if caching."""
+        if self.config.cache_dir is None:
+            return None
+        key = hashlib.sha256(f"{model}\0{prompt}".encode()).hexdigest()
+        return self.config.cache_dir / f"{key}.txt"
+
+    def _load_cached_response(self, model: str, prompt: str) -> str | None:
+        """Return a cached response that hasn't expired yet.
+
+        Expired entries are deleted here so the cache directory doesn't keep
+        every response ever seen. Blocking, so call it off the event loop.
+        """
+        path = self._cache_path(model, prompt)
+        if path is None:
+            return None
+
+        try:
+            age = time.time() - path.stat().st_mtime
+            if age > self.config.cache_ttl_seconds:
+                path.unlink(missing_ok=True)
+                return None
+            return path.read_text(encoding="utf-8") or None
+        except OSError:
+            return None  # Missing or unreadable entries are just misses
+
+    def _store_cached_response(self, model: str, prompt: str, content: str) -> None:
+        """Save a response for reuse; failures only cost the cache hit.
+
+        Blocking, so call it off the event loop.
+        """
+        path = self._cache_path(model, prompt)
+        if path is None:
+            return
+
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            # Written aside and renamed into place, so a concurrent lookup
+            # never reads a partly written response
+            fd, staging = tempfile.mkstemp(
+                dir=path.parent, prefix=f".{path.stem}.", suffix=".tmp"
+            )
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as f:
+                    f.write(content)
+                os.replace(staging, path)
+            except OSError:
+                with contextlib.suppress(OSError):
+                    os.unlink(staging)
+                raise
+        except OSError as e:
+            logger.debug(f"Could not cache response. [path={path}, error={e}]")
@@ -1,13 +1,17 @@
 """Prompt management for LLM dream generation."""
 
+from datetime import date
+from functools import lru_cache
+
+from ..constants import APPROX_CHARS_PER_TOKEN, PROMPT_PREVIEW_TOKEN_BUDGET
 from ..experiences.base import Observation
 
-DREAM_PROMPT_TEMPLATE = """You are a surrealist writer who discovers hidden
+# Everything that doesn't change between calls comes first, so providers can
+# reuse their cached processing of this prefix; discoveries go last
+DREAM_PROMPT_PREFIX = """You are a surrealist writer who discovers hidden
 connections between mundane digital artifacts and impossible dream worlds.
 
-Transform these discoveries into surreal dream imagery:
-
-{observations}
+Transform the discoveries listed at the end into surreal dream imagery.
 
 Think through this process:
 1. Identify key elements: file names, dates, content fragments, numbers
@@ -42,31 +46,64 @@ that glow like Christmas lights, leading deeper into rooms that shouldn't exist.
 Notice the gentler flow - not every element appears, but the dream maintains
 its surreal logic and atmosphere.
 
-Format your output with each sentence on its own line for better readability:
+Format your output with each sentence on its own line for better readability.
+"""
+
+DREAM_PROMPT_SUFFIX = """
+Discoveries:
+{observations}
 
 Output only your connected dream narrative:
 
 """
 
+DREAM_PROMPT_TEMPLATE = DREAM_PROMPT_PREFIX + DREAM_PROMPT_SUFFIX
 
-def format_dream_prompt(observations: list[Observation]) -> str:
-    """Format observations into dream prompt."""
-    if not observations:
-        return DREAM_PROMPT_TEMPLATE.format(observations="(No recent discoveries)")
+# Display labels for the usual observation types
+_TYPE_LABELS = {"file": "File", "directory": "Directory"}
 
-    obs_details = []
-    for obs in observations:
-        detail = f"- {obs.type.title()}: {obs.name}"
 
-        if obs.size_bytes is not None:
-            detail += f" ({obs.size_bytes} bytes)"
-        if hasattr(obs, "timestamp") and obs.timestamp:
-            detail += f" modified {obs.timestamp.strftime('%Y-%m-%d')}"
+@lru_cache(maxsize=1024)
+def _format_date(day: date) -> str:
+    """Format a date for the prompt; a session's observations share few days."""
+    return day.strftime("%Y-%m-%d")
 
-        # Include preview content if available
-        if obs.preview:
-            detail += f"\n  Content preview: {obs.preview}"
 
-        obs_details.append(detail)
+def _render_observation(obs: Observation) -> str:
+    """Render one observation as a bullet in the discoveries list."""
+    label = _TYPE_LABELS.get(obs.type) or obs.type.title()
+    parts = ["- ", label, ": ", obs.name]
 
-    return DREAM_PROMPT_TEMPLATE.format(observations="\n".join(obs_details))
+    if obs.size_bytes is not None:
+        parts.append(f" ({obs.size_bytes} bytes)")
+    if obs.timestamp:
+        parts.append(f" modified {_format_date(obs.timestamp.date())}")
+
+    # Include preview content if available
+    if obs.preview:
+        preview = obs.preview[: PROMPT_PREVIEW_TOKEN_BUDGET * APPROX_CHARS_PER_TOKEN]
+        parts.append(f"\n  Content preview: {preview}")
+
+    return "".join(parts)
+
+
+def format_dream_prompt(observations: list[Observation]) -> str:
+    """Format observations into dream prompt.
+
+    Observations are listed in path order, so the same set of discoveries
+    always produces byte-identical prompts that response caches can match.
+    Previews are truncated so one huge file can't blow up the prompt.
+    """
+    if not observations:
+        return DREAM_PROMPT_PREFIX + DREAM_PROMPT_SUFFIX.format(
+            observations="(No recent discoveries)"
+        )
+
+    obs_details = [
+        _render_observation(obs)
+        for obs in sorted(observations, key=lambda o: (o.path, o.timestamp))
+    ]
+
+    return DREAM_PROMPT_PREFIX + DREAM_PROMPT_SUFFIX.format(
+        observations="\n".join(obs_details)
+    )
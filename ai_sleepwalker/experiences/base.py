@@ -12,7 +12,7 @@ from ..models import FileSystemDiscovery
 ExperienceType = ExperienceMode
 
 
-@dataclass
+@dataclass(slots=True)
 class Observation:
     """Raw observation during filesystem exploration."""
 
@@ -25,7 +25,7 @@ class Observation:
     brief_note: str = ""  # Simple human description
 
 
-@dataclass
+@dataclass(slots=True)
 class ExperienceResult:
     """Final result after experience synthesis."""
 
@@ -1,6 +1,8 @@
 """Dream experience implementation for poetic filesystem reflections."""
 
+import logging
 from datetime import datetime
+from typing import TYPE_CHECKING
 
 from ..models import FileSystemDiscovery
 from .base import (
@@ -11,6 +13,26 @@ from .base import (
     Observation,
 )
 
+if TYPE_CHECKING:
+    from ..core.llm_client import LLMClient
+
+logger = logging.getLogger(__name__)
+
+# Fixed lines around the discoveries in the placeholder dream
+_PLACEHOLDER_INTRO = (
+    "",
+    "## 🌙 The Dream",
+    "",
+    "I wandered through digital corridors of forgotten intentions...",
+    "",
+)
+_PLACEHOLDER_OUTRO = (
+    "",
+    "The dream fades like morning mist, leaving only impressions of "
+    "a digital life lived in files and folders.",
+    "",
+)
+
 
 class DreamCollector(ExperienceCollector):
     """Collects observations for dream synthesis."""
@@ -33,7 +55,8 @@ class DreamCollector(ExperienceCollector):
         )
 
         self._observations.append(observation)
-        print(f"😴 Dreaming of: {note}")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(f"😴 Dreaming of: {note}")
 
     def get_observations(self) -> list[Observation]:
         """Get all collected observations."""
@@ -56,6 +79,7 @@ class DreamSynthesizer(ExperienceSynthesizer):
 
     def __init__(self, model: str = "gemini/gemini-2.5-flash-preview-05-20") -> None:
         self.model = model
+        self._client: LLMClient | None = None
 
     @property
     def experience_type(self) -> ExperienceType:
@@ -70,9 +94,11 @@ class DreamSynthesizer(ExperienceSynthesizer):
         # Use LLM-based dream generation
         from ..core.llm_client import LLMClient, LLMConfig, LLMError
 
-        client = LLMClient(LLMConfig(model=self.model))
+        # Reuse one client across dreams instead of rebuilding it per call
+        if self._client is None:
+            self._client = LLMClient(LLMConfig(model=self.model))
         try:
-            return await client.generate_dream(observations)
+            return await self._client.generate_dream(observations)
         except LLMError as e:
             # Graceful fallback for LLM-specific failures
             print(f"⚠️  LLM generation failed: {e}")
@@ -110,29 +136,16 @@ class DreamSynthesizer(ExperienceSynthesizer):
 
     def _create_placeholder_dream(self, observations: list[Observation]) -> str:
         """Create a placeholder dream narrative until LLM integration is complete."""
+        start = observations[0].timestamp
+        end = observations[-1].timestamp
         lines = [
             "# Digital Dream",
             "",
-            f"*Session: {observations[0].timestamp.strftime('%Y-%m-%d %H:%M')} - "
-            f"{observations[-1].timestamp.strftime('%H:%M')}*",
-            "",
-            "## 🌙 The Dream",
-            "",
-            "I wandered through digital corridors of forgotten intentions...",
-            "",
+            f"*Session: {start:%Y-%m-%d %H:%M} - {end:%H:%M}*",
+            *_PLACEHOLDER_INTRO,
+            # Show first 3 observations
+            *(f"- {obs.brief_note}" for obs in observations[:3]),
+            *_PLACEHOLDER_OUTRO,
+            f"*{len(observations)} observations collected during this session*",
         ]
-
-        for obs in observations[:3]:  # Show first 3 observations
-            lines.append(f"- {obs.brief_note}")
-
-        lines.extend(
-            [
-                "",
-                "The dream fades like morning mist, leaving only impressions of "
-                "a digital life lived in files and folders.",
-                "",
-                f"*{len(observations)} observations collected during this session*",
-            ]
-        )
-
         return "\n".join(lines)
@@ -10,18 +10,98 @@ import os
 import random
 import signal
 import time
+from collections import deque
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 
 import wakepy
 
-from .constants import DiscoveryType
-from .experiences.base import ExperienceType
+from .constants import MAX_EXPLORATION_DEPTH, DiscoveryType
+from .experiences.base import ExperienceSynthesizer, ExperienceType
 from .experiences.factory import ExperienceFactory
 from .models import FileSystemDiscovery
 
 logger = logging.getLogger(__name__)
 
+# Names of tool and cache entries whose subtrees are never explored
+SKIP_NAMES = frozenset(
+    {
+        ".git",
+        "__pycache__",
+        ".cache",
+        "node_modules",
+        ".venv",
+        "venv",
+        ".pytest_cache",
+        ".mypy_cache",
+        ".DS_Store",
+    }
+)
+
+# Extensions that are reported as binary without being read
+PREVIEW_BINARY_EXTENSIONS = frozenset(
+    {
+        ".jpg",
+        ".jpeg",
+        ".png",
+        ".gif",
+        ".pdf",
+        ".exe",
+        ".bin",
+        ".zip",
+        ".tar",
+        ".gz",
+        ".dmg",
+        ".app",
+        ".dylib",
+        ".so",
+    }
+)
+
+# Leading bytes of common binary formats, for files without a telling extension.
+# Windows executables' two-letter "MZ" is left out since plain text can start
+# with it too; their headers are full of NULs, which the content sniff catches.
+BINARY_MAGIC_NUMBERS = (
+    b"\x7fELF",  # ELF executables and libraries
+    b"\xcf\xfa\xed\xfe",  # Mach-O 64-bit
+    b"\xca\xfe\xba\xbe",  # Mach-O universal binaries, Java classes
+    b"\x89PNG",
+    b"\xff\xd8\xff",  # JPEG
+    b"GIF8",
+    b"%PDF",
+    b"PK\x03\x04",  # Zip and zip-based documents
+    b"\x1f\x8b",  # Gzip
+    b"7z\xbc\xaf",
+    b"SQLite format 3\x00",
+)
+
+# Bytes expected in text: tab, newlines and everything from space upwards
+# (UTF-8 multibyte sequences live in 0x80-0xff)
+_TEXT_BYTES = bytes([9, 10, 13, *range(32, 256)])
+
+_PREVIEW_READ_FLAGS = (
+    os.O_RDONLY | getattr(os, "O_BINARY", 0) | getattr(os, "O_CLOEXEC", 0)
+)
+
+# Upper bound on one dream's synthesis, covering the LLM client's own
+# per-request timeouts, retries and fallback models
+DEFAULT_DREAM_TIMEOUT_SECONDS = 120.0
+
+# How long a directory's subdirectory listing is reused for detours
+SUBDIRECTORY_CACHE_TTL_SECONDS = 60
+
+# Most subdirectories a cached listing keeps; bigger directories are
+# reservoir-sampled down to this many while they are listed
+SUBDIRECTORY_SAMPLE_SIZE = 64
+
+# Numbered dream files kept in the output directory; older ones are deleted
+MAX_SAVED_DREAMS = 100
+
+# Private generator for cycle choices, unaffected by anyone seeding the
+# module-level random functions
+_rng = random.Random()
+
 # Global flag for graceful shutdown
 shutdown_requested = False
 
@@ -33,40 +113,93 @@ def signal_handler(signum: int, frame: object) -> None:
     shutdown_requested = True
 
 
-def get_file_preview(file_path: Path, max_bytes: int = 200) -> str | None:
+def get_file_preview(file_path: str | Path, max_bytes: int = 200) -> str | None:
     """Safely get a preview of file contents."""
+    # Skip binary files
+    if os.path.splitext(file_path)[1].lower() in PREVIEW_BINARY_EXTENSIONS:
+        return "[Binary file]"
+
+    # Read the first few bytes with a single raw read, no buffered text stack
     try:
-        # Skip binary files
-        binary_extensions = {
-            ".jpg",
-            ".jpeg",
-            ".png",
-            ".gif",
-            ".pdf",
-            ".exe",
-            ".bin",
-            ".zip",
-            ".tar",
-            ".gz",
-            ".dmg",
-            ".app",
-            ".dylib",
-            ".so",
-        }
-        if file_path.suffix.lower() in binary_extensions:
-            return "[Binary file]"
-
-        # Try to read first few bytes
-        with open(file_path, encoding="utf-8", errors="ignore") as f:
-            preview = f.read(max_bytes)
-            if preview:
-                # Clean up whitespace and truncate
-                preview = " ".join(preview.split())
-                if len(preview) > 100:
-                    preview = preview[:97] + "..."
-                return preview
-    except Exception:
-        pass
+        fd = os.open(file_path, _PREVIEW_READ_FLAGS)
+        try:
+            raw = os.read(fd, max_bytes)
+        finally:
+            os.close(fd)
+    except OSError:
+        return None
+
+    # The same bytes tell binaries without a known extension apart: known
+    # signatures, NULs, or mostly control bytes
+    if (
+        raw.startswith(BINARY_MAGIC_NUMBERS)
+        or b"\x00" in raw
+        or len(raw.translate(None, _TEXT_BYTES)) > len(raw) * 0.3
+    ):
+        return "[Binary file]"
+
+    # Clean up whitespace and truncate
+    preview = " ".join(raw.decode("utf-8", errors="ignore").split())
+    if not preview:
+        return None
+    if len(preview) > 100:
+        preview = preview[:97] + "..."
+    return preview
+
+
+@lru_cache(maxsize=4096)
+def _cached_file_preview(path: str, mtime_ns: int, size: int) -> str | None:
+    """Get a file preview, reused while the file's mtime and size are unchanged.
+
+    mtime_ns and size are only part of the cache key, so edited files miss.
+    """
+    return get_file_preview(path)
+
+
+def _discover_entry(
+    entry: os.DirEntry[str], found_at: datetime
+) -> FileSystemDiscovery | None:
+    """Turn a scanned entry into a discovery, or None if it should be skipped.
+
+    Directories are stamped with found_at, when the walk found them.
+    """
+    # Skip if we can't access it
+    try:
+        if entry.is_file(follow_symlinks=False):
+            stat = entry.stat(follow_symlinks=False)
+            size = stat.st_size
+
+            # Skip very large files
+            if size > 10 * 1024 * 1024:  # 10MB
+                return None
+
+            # Settle what the name and size decide without a read
+            suffix = os.path.splitext(entry.name)[1].lower()
+            if not 0 < size < 100000:
+                preview: str | None = None
+            elif suffix in PREVIEW_BINARY_EXTENSIONS:
+                preview = "[Binary file]"
+            else:
+                preview = _cached_file_preview(entry.path, stat.st_mtime_ns, size)
+
+            return FileSystemDiscovery(
+                path=Path(entry.path),
+                name=entry.name,
+                discovery_type=DiscoveryType.FILE.value,
+                size_bytes=size,
+                preview=preview,
+                timestamp=datetime.fromtimestamp(stat.st_mtime),
+            )
+
+        if entry.is_dir(follow_symlinks=False):
+            return FileSystemDiscovery(
+                path=Path(entry.path),
+                name=entry.name,
+                discovery_type=DiscoveryType.DIRECTORY.value,
+                timestamp=found_at,
+            )
+    except OSError:
+        pass  # Skip files we can't access
 
     return None
 
@@ -77,68 +210,44 @@ def explore_directory(
     """Explore a directory and return discoveries."""
     discoveries = []
     items_found = 0
-
-    # Define patterns to skip
-    skip_patterns = {
-        ".git",
-        "__pycache__",
-        ".cache",
-        "node_modules",
-        ".venv",
-        "venv",
-        ".pytest_cache",
-        ".mypy_cache",
-        ".DS_Store",
-    }
+    # Directories are stamped with when this walk found them
+    found_at = datetime.now()
 
     try:
-        # Use rglob with a depth limit
-        for item in base_path.rglob("*"):
-            if items_found >= max_items:
-                break
-
-            # Skip if any part of path contains skip patterns
-            if any(skip in str(item) for skip in skip_patterns):
-                continue
-
-            # Skip if we can't access it
+        # Walk with scandir so type checks and stat() reuse the metadata
+        # returned while listing each directory; pending directories are
+        # kept in a stack, pushed in reverse to visit them in listing order,
+        # with their depth below base_path
+        pending = [(os.fspath(base_path), 0)]
+        while pending and items_found < max_items:
+            dir_path, depth = pending.pop()
+            subdirs = []
             try:
-                if item.is_file():
-                    stat = item.stat()
-                    size = stat.st_size
-
-                    # Skip very large files
-                    if size > 10 * 1024 * 1024:  # 10MB
-                        continue
-
-                    preview = get_file_preview(item) if size < 100000 else None
-
-                    discoveries.append(
-                        FileSystemDiscovery(
-                            path=item,
-                            name=item.name,
-                            discovery_type=DiscoveryType.FILE.value,
-                            size_bytes=size,
-                            preview=preview,
-                            timestamp=datetime.fromtimestamp(stat.st_mtime),
-                        )
-                    )
-                    items_found += 1
-
-                elif item.is_dir():
-                    discoveries.append(
-                        FileSystemDiscovery(
-                            path=item,
-                            name=item.name,
-                            discovery_type=DiscoveryType.DIRECTORY.value,
-                            timestamp=datetime.now(),
-                        )
-                    )
-                    items_found += 1
-
-            except (PermissionError, OSError):
-                # Skip files we can't access
-                continue
+                # Entries are used as they stream in, so a huge directory is
+                # only listed as far as the remaining item budget needs
+                with os.scandir(dir_path) as it:
+                    for entry in it:
+                        if items_found >= max_items:
+                            break
+
+                        # Skipped directories are never pushed, pruning their
+                        # subtrees
+                        if entry.name in SKIP_NAMES:
+                            continue
+
+                        discovery = _discover_entry(entry, found_at)
+                        if discovery is None:
+                            continue
+                        discoveries.append(discovery)
+                        items_found += 1
+                        if discovery.discovery_type == DiscoveryType.DIRECTORY.value:
+                            subdirs.append(entry.path)
+            except OSError:
+                pass  # Unreadable (rest of the) directory, keep what was found
+
+            # Only descend while the subdirectories' entries stay in range
+            if depth + 2 <= MAX_EXPLORATION_DEPTH:
+                pending.extend((path, depth + 1) for path in reversed(subdirs))
 
     except Exception as e:
         logger.warning(f"Error exploring {base_path}: {e}")
@@ -146,38 +255,127 @@ def explore_directory(
     return discoveries
 
 
-def select_random_subdirectory(base_path: Path) -> Path:
-    """Select a random subdirectory to explore."""
-    try:
-        # Get all accessible subdirectories
-        subdirs = []
-        for item in base_path.iterdir():
+@lru_cache(maxsize=64)
+def _sample_subdirectories(base_path: str, ttl_bucket: int) -> tuple[str, ...]:
+    """Sample accessible, non-hidden subdirectories of base_path.
+
+    At most SUBDIRECTORY_SAMPLE_SIZE paths are kept, every subdirectory
+    being equally likely to be among them, so memory stays bounded however
+    large the directory is. ttl_bucket only keys the cache, so samples are
+    reused until the bucket advances.
+    """
+    sample: list[str] = []
+    seen = 0
+    with os.scandir(base_path) as it:
+        for entry in it:
+            if entry.name.startswith("."):
+                continue
             try:
-                if item.is_dir() and not item.name.startswith("."):
-                    subdirs.append(item)
-            except (PermissionError, OSError):
+                if not entry.is_dir():
+                    continue
+            except OSError:
                 continue
 
+            seen += 1
+            if len(sample) < SUBDIRECTORY_SAMPLE_SIZE:
+                sample.append(entry.path)
+            else:
+                slot = _rng.randrange(seen)
+                if slot < SUBDIRECTORY_SAMPLE_SIZE:
+                    sample[slot] = entry.path
+    return tuple(sample)
+
+
+def select_random_subdirectory(base_path: Path) -> Path:
+    """Select a random subdirectory to explore."""
+    try:
+        # Top-level layouts rarely change, so listings are cached briefly
+        ttl_bucket = int(time.monotonic() // SUBDIRECTORY_CACHE_TTL_SECONDS)
+        subdirs = _sample_subdirectories(os.fspath(base_path), ttl_bucket)
         if subdirs:
-            return random.choice(subdirs)
+            return Path(_rng.choice(subdirs))
     except Exception:
         pass
 
     return base_path
 
 
+def save_dream(dream_file: Path, latest_file: Path, content: str) -> None:
+    """Write a dream file and make latest_file show the same dream.
+
+    The latest file is a hard link swapped in with one atomic rename, so
+    readers never see it half-written and the content is written once.
+    """
+    dream_file.write_text(content)
+
+    # Staging name is per dream, so concurrent cycles don't collide
+    staging = latest_file.with_name(f".{dream_file.name}.latest")
+    try:
+        staging.unlink(missing_ok=True)
+        os.link(dream_file, staging)
+        os.replace(staging, latest_file)
+    except OSError:
+        # Filesystems without hard links get a copy instead
+        latest_file.write_text(content)
+
+
+def load_saved_dreams(output_dir: Path) -> deque[Path]:
+    """Index dream files from earlier sessions, trimming them to the limit.
+
+    Files are ordered by modification time rather than name, since each
+    session numbers its dreams from 1 again.
+    """
+    found = []
+    with os.scandir(output_dir) as it:
+        for entry in it:
+            if entry.name.startswith("dream_") and entry.name.endswith(".md"):
+                try:
+                    if entry.is_file():
+                        found.append((entry.stat().st_mtime_ns, entry.path))
+                except OSError:
+                    continue
+    dream_files = [Path(path) for _, path in sorted(found)]
+    for old_file in dream_files[:-MAX_SAVED_DREAMS]:
+        old_file.unlink(missing_ok=True)
+    if len(dream_files) > MAX_SAVED_DREAMS:
+        logger.info(f"🧹 Cleaned up {len(dream_files) - MAX_SAVED_DREAMS} old dreams")
+    return deque(dream_files[-MAX_SAVED_DREAMS:], maxlen=MAX_SAVED_DREAMS)
+
+
+def record_saved_dream(saved_dreams: deque[Path], dream_file: Path) -> Path | None:
+    """Track a written dream file.
+
+    Returns:
+        The oldest dream file, once the limit is hit, for the caller to
+        delete; None otherwise.
+    """
+    evicted = None
+    if dream_file in saved_dreams:
+        # Rewritten in place, e.g. a new session reusing an old number
+        saved_dreams.remove(dream_file)
+    elif len(saved_dreams) == saved_dreams.maxlen:
+        evicted = saved_dreams.popleft()
+    saved_dreams.append(dream_file)
+    return evicted
+
+
 async def sleepwalk_cycle(
-    cycle_num: int, search_paths: list[Path], output_dir: Path
+    cycle_num: int,
+    search_paths: list[Path],
+    output_dir: Path,
+    saved_dreams: deque[Path],
+    synthesizer: ExperienceSynthesizer,
+    dream_timeout: float = DEFAULT_DREAM_TIMEOUT_SECONDS,
 ) -> None:
     """Run one complete sleepwalking cycle."""
     logger.info(f"🌙 Starting sleepwalk cycle #{cycle_num}")
 
     # Choose a random path from allowed directories
-    search_path = random.choice(search_paths)
+    search_path = _rng.choice(search_paths)
 
     # Sometimes explore a subdirectory for variety
-    if random.random() < 0.3 and cycle_num > 1:
-        explore_path = select_random_subdirectory(search_path)
+    if _rng.random() < 0.3 and cycle_num > 1:
+        explore_path = await asyncio.to_thread(select_random_subdirectory, search_path)
         if explore_path != search_path:
             logger.info(f"📂 Exploring subdirectory: {explore_path}")
     else:
@@ -185,25 +383,30 @@ async def sleepwalk_cycle(
 
     # Explore filesystem
     logger.info(f"🔍 Exploring {explore_path}...")
-    discoveries = explore_directory(explore_path, max_items=random.randint(5, 15))
+    # Walk in a worker thread so concurrent cycles can await their dreams
+    discoveries = await asyncio.to_thread(
+        explore_directory, explore_path, max_items=_rng.randint(5, 15)
+    )
 
     if not discoveries:
         logger.warning("⚠️  No accessible files found, trying parent directory...")
-        discoveries = explore_directory(search_path, max_items=10)
+        discoveries = await asyncio.to_thread(
+            explore_directory, search_path, max_items=10
+        )
 
     logger.info(f"📁 Found {len(discoveries)} items in filesystem")
 
     # Log some of what was found
-    for d in discoveries[:3]:
-        icon = "📄" if d.discovery_type == "file" else "📁"
-        size_info = f" ({d.size_bytes} bytes)" if d.size_bytes else ""
-        logger.info(f"   {icon} {d.name}{size_info}")
-    if len(discoveries) > 3:
-        logger.info(f"   ... and {len(discoveries) - 3} more items")
-
-    # Create experience components
+    if logger.isEnabledFor(logging.INFO):
+        for d in discoveries[:3]:
+            icon = "📄" if d.discovery_type == "file" else "📁"
+            size_info = f" ({d.size_bytes} bytes)" if d.size_bytes else ""
+            logger.info(f"   {icon} {d.name}{size_info}")
+        if len(discoveries) > 3:
+            logger.info(f"   ... and {len(discoveries) - 3} more items")
+
+    # Collectors hold one cycle's observations, so each cycle gets its own
     collector = ExperienceFactory.create_collector(ExperienceType.DREAM)
-    synthesizer = ExperienceFactory.create_synthesizer(ExperienceType.DREAM)
 
     # Collect observations
     for discovery in discoveries:
@@ -213,11 +416,13 @@ async def sleepwalk_cycle(
 
     # Generate dream
     logger.info("💭 Generating dream narrative...")
-    start_time = time.time()
+    start_time = time.perf_counter()
 
     try:
-        result = await synthesizer.synthesize(observations)
-        duration = time.time() - start_time
+        result = await asyncio.wait_for(
+            synthesizer.synthesize(observations), timeout=dream_timeout
+        )
+        duration = time.perf_counter() - start_time
 
         # Log summary
         logger.info(f"✨ Dream generated in {duration:.2f}s")
@@ -227,7 +432,7 @@ async def sleepwalk_cycle(
 
         # Add metadata header
         dream_content = f"""# Dream #{cycle_num}
-Generated: {datetime.now().strftime("%Y-%m-%d %H:%M:%S")}
+Generated: {time.strftime("%Y-%m-%d %H:%M:%S")}
 Explored: {explore_path}
 Discoveries: {len(discoveries)}
 
@@ -236,17 +441,25 @@ Discoveries: {len(discoveries)}
 {result.content}
 """
 
-        dream_file.write_text(dream_content)
-
-        # Also save latest dream
+        # Write off the event loop so concurrent cycles keep running
         latest_file = output_dir / "latest_dream.md"
-        latest_file.write_text(dream_content)
+        await asyncio.to_thread(save_dream, dream_file, latest_file, dream_content)
+        # Bookkeeping stays on the loop; only the delete goes to a thread
+        evicted = record_saved_dream(saved_dreams, dream_file)
+        if evicted is not None:
+            await asyncio.to_thread(evicted.unlink, missing_ok=True)
 
         logger.info(f"💾 Dream saved to {dream_file}")
 
         # Show snippet of dream
-        snippet = result.content[:100].replace("\n", " ")
-        logger.info(f"📝 Dream snippet: {snippet}...")
+        if logger.isEnabledFor(logging.INFO):
+            snippet = result.content[:100].replace("\n", " ")
+            logger.info(f"📝 Dream snippet: {snippet}...")
+
+    except asyncio.TimeoutError:
+        logger.error(f"❌ Dream generation timed out after {dream_timeout:.0f}s")
+        logger.info("😴 Using meditation pause instead...")
+        await asyncio.sleep(10)
 
     except Exception as e:
         logger.error(f"❌ Dream generation failed: {e}")
@@ -296,17 +509,52 @@ async def start_sleepwalking(
     logger.info("⏰ Will explore and dream continuously")
     logger.info("   Press Ctrl+C to stop\n")
 
+    # Cycles to run concurrently, so their dream requests overlap
+    try:
+        batch_size = max(1, int(os.getenv("SLEEPWALKER_BATCH", "1")))
+    except ValueError:
+        logger.warning("⚠️  Ignoring invalid SLEEPWALKER_BATCH, running one cycle")
+        batch_size = 1
+    if batch_size > 1:
+        logger.info(f"🧺 Running {batch_size} cycles at a time")
+
+    # SLEEPWALK_LLM_TIMEOUT is accepted as an alias for the same setting
+    timeout_setting = os.getenv("SLEEPWALKER_LLM_TIMEOUT") or os.getenv(
+        "SLEEPWALK_LLM_TIMEOUT"
+    )
+    try:
+        dream_timeout = (
+            float(timeout_setting) if timeout_setting else DEFAULT_DREAM_TIMEOUT_SECONDS
+        )
+    except ValueError:
+        logger.warning("⚠️  Ignoring invalid SLEEPWALKER_LLM_TIMEOUT")
+        dream_timeout = DEFAULT_DREAM_TIMEOUT_SECONDS
+
+    saved_dreams = load_saved_dreams(output_dir)
+    synthesizer = ExperienceFactory.create_synthesizer(ExperienceType.DREAM)
     cycle = 1
 
     # Use wakepy to prevent sleep and screen lock
     with wakepy.keep.presenting():
         while not shutdown_requested:
             try:
-                # Run sleepwalk cycle
-                await sleepwalk_cycle(cycle, search_paths, output_dir)
+                # Run sleepwalk cycles
+                await asyncio.gather(
+                    *(
+                        sleepwalk_cycle(
+                            cycle + i,
+                            search_paths,
+                            output_dir,
+                            saved_dreams,
+                            synthesizer,
+                            dream_timeout,
+                        )
+                        for i in range(batch_size)
+                    )
+                )
 
                 # Random wait between cycles (30s to 2 min)
-                wait_time = random.randint(30, 120)
+                wait_time = _rng.randint(30, 120)
                 logger.info(f"😴 Resting for {wait_time}s before next exploration...\n")
 
                 # Sleep in small chunks to check for shutdown
@@ -315,17 +563,7 @@ async def start_sleepwalking(
                         break
                     await asyncio.sleep(1)
 
-                cycle += 1
-
-                # Clean up old dreams periodically (keep last 100)
-                if cycle % 50 == 0:
-                    dream_files = sorted(output_dir.glob("dream_*.md"))
-                    if len(dream_files) > 100:
-                        for old_file in dream_files[:-100]:
-                            old_file.unlink()
-                        logger.info(
-                            f"🧹 Cleaned up {len(dream_files) - 100} old dreams"
-                        )
+                cycle += batch_size
 
             except Exception as e:
                 logger.error(f"❌ Unexpected error: {e}")
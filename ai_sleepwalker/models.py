@@ -9,7 +9,7 @@ from datetime import datetime
 from pathlib import Path
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class FileSystemDiscovery:
     """A discovered filesystem item during exploration.
 
@@ -37,7 +37,7 @@ class FileSystemDiscovery:
         return self.discovery_type == "directory"
 
 
-@dataclass
+@dataclass(slots=True)
 class ExplorationSession:
     """Represents a complete filesystem exploration session.
 
@@ -71,7 +71,7 @@ class ExplorationSession:
         self.end_time = datetime.now()
 
 
-@dataclass
+@dataclass(slots=True)
 class IdleState:
     """Represents the current idle state of the system."""
 
@@ -88,7 +88,7 @@ class IdleState:
         return max(0.0, self.threshold_seconds - self.idle_duration_seconds)
 
 
-@dataclass
+@dataclass(slots=True)
 class SleepPreventionState:
     """Tracks the current state of sleep prevention."""
 
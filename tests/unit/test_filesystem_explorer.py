@@ -241,6 +241,54 @@ class TestFilesystemExplorerWandering:
                 "Should not exceed discovery limit"
             )
 
+    async def test_wander_batch_returns_discoveries_with_previews(self):
+        """Test that wander_batch() makes several discoveries in one call."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            temp_path = Path(temp_dir)
+
+            for i in range(5):
+                (temp_path / f"note{i}.txt").write_text(f"note number {i}")
+
+            explorer = FilesystemExplorer([str(temp_path)])
+
+            discoveries = await explorer.wander_batch(10)
+
+            assert 0 < len(discoveries) <= 10
+            assert explorer.discoveries_made == len(discoveries)
+            resolved_temp_path = temp_path.resolve()
+            for discovery in discoveries:
+                assert discovery.path.is_relative_to(resolved_temp_path)
+                if discovery.is_file:
+                    assert discovery.preview is not None
+                    assert discovery.preview.startswith("note number")
+
+    async def test_wander_batch_respects_discovery_limits(self):
+        """Test that wander_batch() stops at MAX_DISCOVERIES_PER_SESSION."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            temp_path = Path(temp_dir)
+            (temp_path / "file.txt").write_text("content")
+
+            explorer = FilesystemExplorer([str(temp_path)])
+
+            discoveries = await explorer.wander_batch(MAX_DISCOVERIES_PER_SESSION * 2)
+
+            assert len(discoveries) <= MAX_DISCOVERIES_PER_SESSION
+            assert await explorer.wander_batch(1) == []
+
+    def test_wander_iter_yields_until_discovery_limit(self):
+        """Test that wander_iter() stops at MAX_DISCOVERIES_PER_SESSION."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            temp_path = Path(temp_dir)
+            (temp_path / "file.txt").write_text("content")
+
+            explorer = FilesystemExplorer([str(temp_path)])
+
+            discoveries = list(explorer.wander_iter())
+
+            assert 0 < len(discoveries) <= MAX_DISCOVERIES_PER_SESSION
+            assert explorer.discoveries_made == len(discoveries)
+            assert explorer.wander() is None
+
 
 class TestFilesystemExplorerSecurity:
     """Test security boundaries and path validation."""
@@ -289,6 +337,54 @@ class TestFilesystemExplorerSecurity:
                 f"Security validation failed for {test_case.name}"
             )
 
+    def test_is_safe_path_rejects_prefix_sibling(self):
+        """Test that a sibling sharing a name prefix is not treated as inside."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            safe_dir = Path(temp_dir) / "safe"
+            safe_dir.mkdir()
+            sibling_dir = Path(temp_dir) / "safer"
+            sibling_dir.mkdir()
+
+            explorer = FilesystemExplorer([str(safe_dir)])
+
+            assert explorer._is_safe_path(safe_dir)
+            assert not explorer._is_safe_path(sibling_dir / "file.txt")
+
+    def test_is_safe_path_with_multiple_and_nested_allowed_dirs(self):
+        """Test containment when allowed dirs are nested or share prefixes."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            base = Path(temp_dir)
+            for name in ["a", "a/b", "a-b", "c"]:
+                (base / name).mkdir()
+
+            explorer = FilesystemExplorer(
+                [str(base / "a" / "b"), str(base / "a"), str(base / "c")]
+            )
+
+            assert explorer._is_safe_path(base / "a" / "other" / "file.txt")
+            assert explorer._is_safe_path(base / "a" / "b" / "file.txt")
+            assert explorer._is_safe_path(base / "c" / "file.txt")
+            assert not explorer._is_safe_path(base / "a-b" / "file.txt")
+            assert not explorer._is_safe_path(base / "b" / "file.txt")
+
+    def test_is_safe_path_rejects_symlink_escape(self):
+        """Test that symlinks pointing outside allowed dirs are rejected."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            safe_dir = Path(temp_dir) / "safe"
+            safe_dir.mkdir()
+            outside_dir = Path(temp_dir) / "outside"
+            outside_dir.mkdir()
+            link = safe_dir / "escape"
+            link.symlink_to(outside_dir)
+
+            explorer = FilesystemExplorer([str(safe_dir)])
+
+            # Both the link and anything beneath it resolve outside the boundary
+            assert not explorer._is_safe_path(link)
+            assert not explorer._is_safe_path(link / "file.txt")
+            # Parent traversal from a cached directory must still resolve
+            assert not explorer._is_safe_path(safe_dir / "..")
+
     def test_wander_never_escapes_allowed_directories(self):
         """Test that wander() never returns discoveries outside allowed dirs."""
         with tempfile.TemporaryDirectory() as temp_dir:
@@ -317,6 +413,61 @@ class TestFilesystemExplorerSecurity:
                         f"{resolved_safe_dir}"
                     )
 
+    def test_wander_rechecks_directory_swapped_for_symlink(self):
+        """Test that a directory replaced by an outside symlink isn't trusted."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            temp_path = Path(temp_dir)
+            safe_dir = temp_path / "safe"
+            sub_dir = safe_dir / "sub"
+            sub_dir.mkdir(parents=True)
+            (sub_dir / "notes.txt").write_text("safe notes for the dream")
+            outside_dir = temp_path / "outside"
+            outside_dir.mkdir()
+            (outside_dir / "secret.txt").write_text("secret outside content")
+
+            explorer = FilesystemExplorer([str(safe_dir)])
+
+            # Explore the subdirectory while it is a real directory
+            explorer.current_path = sub_dir
+            assert explorer.wander() is not None
+
+            (sub_dir / "notes.txt").unlink()
+            sub_dir.rmdir()
+            sub_dir.symlink_to(outside_dir)
+
+            resolved_safe_dir = safe_dir.resolve()
+            for _ in range(30):
+                explorer.current_path = sub_dir
+                discovery = explorer.wander()
+                if discovery:
+                    assert discovery.name != "secret.txt"
+                    assert "secret" not in (discovery.preview or "")
+                    assert discovery.path.resolve().is_relative_to(resolved_safe_dir)
+
+    def test_wander_rechecks_allowed_root_swapped_for_symlink(self):
+        """Test that an allowed root replaced by an outside symlink isn't trusted."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            temp_path = Path(temp_dir)
+            safe_dir = temp_path / "safe"
+            safe_dir.mkdir()
+            (safe_dir / "notes.txt").write_text("safe notes for the dream")
+            outside_dir = temp_path / "outside"
+            outside_dir.mkdir()
+            (outside_dir / "secret.txt").write_text("secret outside content")
+
+            explorer = FilesystemExplorer([str(safe_dir)])
+            assert explorer.wander() is not None
+
+            (safe_dir / "notes.txt").unlink()
+            safe_dir.rmdir()
+            safe_dir.symlink_to(outside_dir)
+
+            for _ in range(30):
+                discovery = explorer.wander()
+                if discovery:
+                    assert discovery.name != "secret.txt"
+                    assert "secret" not in (discovery.preview or "")
+
     def test_wander_handles_permission_errors_gracefully(self):
         """Test that wander() handles permission errors without crashing."""
         with tempfile.TemporaryDirectory() as temp_dir:
@@ -421,3 +572,51 @@ class TestFilesystemExplorerDiscoveryCreation:
             assert binary_discovery.size_bytes > 0
             # Binary files should not have previews
             assert binary_discovery.preview is None
+
+    def test_wander_skips_preview_for_binary_content_with_text_extension(self):
+        """Test that binary content is sniffed even behind a text extension."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            temp_path = Path(temp_dir)
+
+            # Text extension, but mostly control bytes
+            disguised_file = temp_path / "notes.txt"
+            disguised_file.write_bytes(b"\x00\x01\x02\x03" * 64)
+
+            explorer = FilesystemExplorer([str(temp_path)])
+
+            discoveries = []
+            for _ in range(20):
+                discovery = explorer.wander()
+                if discovery and discovery.path.name == "notes.txt":
+                    discoveries.append(discovery)
+                    break
+
+            assert len(discoveries) > 0, "Should discover the disguised file"
+            assert discoveries[0].size_bytes == 256
+            assert discoveries[0].preview is None
+
+    def test_wander_refreshes_preview_after_file_changes(self):
+        """Test that a rediscovered file's preview reflects its current content."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            temp_path = Path(temp_dir)
+            notes = temp_path / "notes.txt"
+            notes.write_text("first draft of the notes")
+
+            explorer = FilesystemExplorer([str(temp_path)])
+
+            def find_notes():
+                for _ in range(30):
+                    discovery = explorer.wander()
+                    if discovery and discovery.path.name == "notes.txt":
+                        return discovery
+                return None
+
+            first = find_notes()
+            assert first is not None
+            assert first.preview == "first draft of the notes"
+
+            notes.write_text("second, rather longer draft of the notes")
+
+            second = find_notes()
+            assert second is not None
+            assert second.preview == "second, rather longer draft of the notes"
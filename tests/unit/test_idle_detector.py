@@ -151,6 +151,33 @@ class TestIdleDetectionBehavior:
         # Assert - Timestamp should be updated to more recent time
         assert detector_with_short_threshold.last_activity > old_timestamp
 
+    @pytest.mark.unit
+    def test_mouse_moves_are_sampled(
+        self, detector_with_short_threshold: IdleDetector
+    ) -> None:
+        """Mouse moves only record activity once the sample interval has passed."""
+        # Arrange - Recent activity, inside the sample interval
+        detector_with_short_threshold.last_activity = datetime.now() - timedelta(
+            seconds=0.5
+        )
+        recent = detector_with_short_threshold.last_activity
+
+        # Act & Assert - Move is dropped, timestamp stays put
+        detector_with_short_threshold._on_move(100, 200)
+        assert detector_with_short_threshold.last_activity - recent < timedelta(
+            seconds=0.1
+        )
+
+        # Arrange - Idle, well past the sample interval
+        detector_with_short_threshold.last_activity = datetime.now() - timedelta(
+            seconds=2
+        )
+        assert detector_with_short_threshold.is_idle
+
+        # Act & Assert - Move is recorded as activity
+        detector_with_short_threshold._on_move(100, 200)
+        assert not detector_with_short_threshold.is_idle
+
     @pytest.mark.unit
     def test_activity_callback_accepts_various_arguments(self) -> None:
         """Activity callback handles various argument patterns from pynput listeners."""
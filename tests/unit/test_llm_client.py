@@ -1,8 +1,12 @@
 """Tests for LLM client functionality."""
 
 # ruff: noqa: E501
+import asyncio
+import os
+import time
 from dataclasses import dataclass
 from datetime import datetime
+from pathlib import Path
 from typing import Any
 from unittest.mock import AsyncMock, patch
 
@@ -13,6 +17,7 @@ from ai_sleepwalker.core.llm_client import (
     LLMClient,
     LLMConfig,
 )
+from ai_sleepwalker.core.prompts import DREAM_PROMPT_PREFIX, format_dream_prompt
 from ai_sleepwalker.experiences.base import ExperienceResult, Observation
 
 
@@ -55,6 +60,13 @@ class MockUsage:
     completion_tokens: int = 50
 
 
+@dataclass
+class MockPromptTokensDetails:
+    """Mock prompt token breakdown."""
+
+    cached_tokens: int = 0
+
+
 class TestLLMConfig:
     """Test suite for LLM configuration."""
 
@@ -205,6 +217,7 @@ class TestLLMClient:
 
             assert call_args.kwargs["model"] == llm_config.model
             assert call_args.kwargs["timeout"] == llm_config.timeout
+            assert call_args.kwargs["num_retries"] == llm_config.num_retries
             assert "messages" in call_args.kwargs
             assert len(call_args.kwargs["messages"]) == 1
             assert call_args.kwargs["messages"][0]["role"] == "user"
@@ -277,11 +290,151 @@ class TestLLMClient:
                     == "Formatted test prompt"
                 )
 
+    @pytest.mark.asyncio
+    async def test_generate_dream_marks_static_prefix_for_anthropic_caching(
+        self, sample_observations: list[Observation], mock_llm_response: MockLLMResponse
+    ) -> None:
+        """Test that Anthropic routes get a cache breakpoint after the static prefix."""
+        client = LLMClient(LLMConfig(model="anthropic/claude-3-5-haiku-latest"))
+
+        with patch("litellm.acompletion", new_callable=AsyncMock) as mock_completion:
+            mock_completion.return_value = mock_llm_response
+
+            await client.generate_dream(sample_observations)
+
+            content = mock_completion.call_args.kwargs["messages"][0]["content"]
+            assert content[0]["text"] == DREAM_PROMPT_PREFIX
+            assert content[0]["cache_control"] == {"type": "ephemeral"}
+            assert "cache_control" not in content[1]
+            assert content[0]["text"] + content[1]["text"] == format_dream_prompt(
+                sample_observations
+            )
+
+    @pytest.mark.asyncio
+    async def test_generate_dream_reuses_cached_response(
+        self,
+        tmp_path: Path,
+        sample_observations: list[Observation],
+        mock_llm_response: MockLLMResponse,
+    ) -> None:
+        """Test that a cached response skips the API call for the same prompt."""
+        client = LLMClient(LLMConfig(cache_dir=tmp_path))
+
+        with patch("litellm.acompletion", new_callable=AsyncMock) as mock_completion:
+            mock_completion.return_value = mock_llm_response
+
+            first = await client.generate_dream(sample_observations)
+            second = await client.generate_dream(sample_observations)
+
+            mock_completion.assert_called_once()
+            assert second.content == first.content
+            assert second.metadata["cached"] is True
+            # Only the finished entry is left, no staging files
+            assert [p.suffix for p in tmp_path.iterdir()] == [".txt"]
+
+            # A different prompt still goes to the API
+            await client.generate_dream(sample_observations[:1])
+            assert mock_completion.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_generate_dream_skips_cache_io_when_disabled(
+        self,
+        llm_config: LLMConfig,
+        sample_observations: list[Observation],
+        mock_llm_response: MockLLMResponse,
+    ) -> None:
+        """Test that no cache lookups or stores run without a cache_dir."""
+        client = LLMClient(llm_config)
+
+        with (
+            patch("litellm.acompletion", new_callable=AsyncMock) as mock_completion,
+            patch(
+                "ai_sleepwalker.core.llm_client.asyncio.to_thread",
+                new_callable=AsyncMock,
+            ) as mock_to_thread,
+        ):
+            mock_completion.return_value = mock_llm_response
+
+            await client.generate_dream(sample_observations)
+
+            mock_to_thread.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_generate_dream_ignores_expired_cached_response(
+        self,
+        tmp_path: Path,
+        sample_observations: list[Observation],
+        mock_llm_response: MockLLMResponse,
+    ) -> None:
+        """Test that cached responses past their TTL are not reused."""
+        client = LLMClient(LLMConfig(cache_dir=tmp_path, cache_ttl_seconds=0))
+
+        with patch("litellm.acompletion", new_callable=AsyncMock) as mock_completion:
+            mock_completion.return_value = mock_llm_response
+
+            await client.generate_dream(sample_observations)
+            time.sleep(0.01)
+            await client.generate_dream(sample_observations)
+
+            assert mock_completion.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_generate_dream_deletes_expired_cache_entries(
+        self,
+        tmp_path: Path,
+        sample_observations: list[Observation],
+        mock_llm_response: MockLLMResponse,
+    ) -> None:
+        """Test that an expired cache entry is removed when it is looked up."""
+        client = LLMClient(LLMConfig(cache_dir=tmp_path, cache_ttl_seconds=60))
+
+        with patch("litellm.acompletion", new_callable=AsyncMock) as mock_completion:
+            mock_completion.return_value = mock_llm_response
+            await client.generate_dream(sample_observations)
+
+            (entry,) = tmp_path.iterdir()
+            stale = time.time() - 120
+            os.utime(entry, (stale, stale))
+
+            # The refetch fails, so nothing replaces the deleted entry
+            mock_completion.side_effect = Exception("API Error")
+            with pytest.raises(LLMAPIError):
+                await client.generate_dream(sample_observations)
+
+            assert list(tmp_path.iterdir()) == []
+
+    @pytest.mark.asyncio
+    async def test_generate_dreams_batch_limits_concurrency(
+        self,
+        llm_config: LLMConfig,
+        sample_observations: list[Observation],
+        mock_llm_response: MockLLMResponse,
+    ) -> None:
+        """Test that batched dreams keep order and respect the concurrency cap."""
+        client = LLMClient(llm_config)
+        in_flight = 0
+        peak = 0
+
+        async def completion(**kwargs: Any) -> MockLLMResponse:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return mock_llm_response
+
+        batches = [sample_observations[:1], sample_observations] * 2
+        with patch("litellm.acompletion", side_effect=completion):
+            results = await client.generate_dreams_batch(batches, max_concurrency=2)
+
+        assert [r.total_observations for r in results] == [1, 2, 1, 2]
+        assert peak == 2
+
     @pytest.mark.asyncio
     async def test_generate_dream_with_empty_observations(
         self, llm_config: LLMConfig, mock_llm_response: MockLLMResponse
     ) -> None:
-        """Test dream generation with no observations."""
+        """Test dream generation with no observations skips the API call."""
         client = LLMClient(llm_config)
 
         with patch("litellm.acompletion", new_callable=AsyncMock) as mock_completion:
@@ -291,6 +444,8 @@ class TestLLMClient:
 
             assert isinstance(result, ExperienceResult)
             assert result.metadata["observation_count"] == 0
+            assert result.metadata["skipped"] == "no_observations"
+            mock_completion.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_generate_dream_api_failure_raises_exception(
@@ -316,12 +471,9 @@ class TestLLMClient:
         client = LLMClient(config)
 
         with patch("litellm.acompletion", new_callable=AsyncMock) as mock_completion:
-            # Primary model fails 3 times (retry exhausted), fallback succeeds
-            primary_failure = Exception("Primary model failed")
+            # Primary model fails (litellm's own retries exhausted), fallback succeeds
             mock_completion.side_effect = [
-                primary_failure,
-                primary_failure,
-                primary_failure,  # 3 retries for primary
+                Exception("Primary model failed"),
                 mock_llm_response,  # Fallback succeeds
             ]
 
@@ -329,7 +481,37 @@ class TestLLMClient:
 
             assert isinstance(result, ExperienceResult)
             assert result.metadata["model"] == "gpt-4o-mini"  # Should use fallback
-            assert mock_completion.call_count == 4  # 3 retries + 1 fallback
+            assert mock_completion.call_count == 2  # 1 primary + 1 fallback
+
+    @pytest.mark.asyncio
+    async def test_generate_dream_hedges_slow_primary_with_fallback(
+        self, sample_observations: list[Observation], mock_llm_response: MockLLMResponse
+    ) -> None:
+        """Test that a slow primary is raced by the fallback after the hedge delay."""
+        config = LLMConfig(
+            model="gemini/gemini-2.5-flash-preview",
+            fallback_models=["gpt-4o-mini"],
+            hedge_delay_seconds=0.01,
+        )
+        client = LLMClient(config)
+        primary_cancelled = asyncio.Event()
+
+        async def completion(**kwargs: Any) -> MockLLMResponse:
+            if kwargs["model"] == config.model:
+                try:
+                    await asyncio.sleep(10)
+                except asyncio.CancelledError:
+                    primary_cancelled.set()
+                    raise
+            return mock_llm_response
+
+        with patch("litellm.acompletion", side_effect=completion):
+            result = await asyncio.wait_for(
+                client.generate_dream(sample_observations), timeout=5
+            )
+
+        assert result.metadata["model"] == "gpt-4o-mini"
+        await asyncio.wait_for(primary_cancelled.wait(), timeout=1)
 
     @pytest.mark.asyncio
     async def test_generate_dream_enhanced_metadata(
@@ -358,6 +540,26 @@ class TestLLMClient:
             assert "content_length" in metadata
             assert metadata["total_tokens"] == 250
 
+    @pytest.mark.asyncio
+    async def test_generate_dream_records_prompt_cache_usage(
+        self,
+        llm_config: LLMConfig,
+        sample_observations: list[Observation],
+        mock_llm_response: MockLLMResponse,
+    ) -> None:
+        """Test that provider prompt-cache token counts land in metadata."""
+        mock_llm_response.usage.prompt_tokens_details = MockPromptTokensDetails(80)
+
+        client = LLMClient(llm_config)
+
+        with patch("litellm.acompletion", new_callable=AsyncMock) as mock_completion:
+            mock_completion.return_value = mock_llm_response
+
+            result = await client.generate_dream(sample_observations)
+
+            assert result.metadata["cached_tokens"] == 80
+            assert "cache_read_input_tokens" not in result.metadata
+
     @pytest.mark.asyncio
     async def test_generate_dream_validation_error(
         self, llm_config: LLMConfig, sample_observations: list[Observation]
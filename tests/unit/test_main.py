@@ -0,0 +1,310 @@
+"""Unit tests for the sleepwalker orchestrator helpers.
+
+Following testing conventions:
+- Test behavior, not implementation details
+- Use real temp directories instead of mocks
+"""
+
+import asyncio
+import logging
+import os
+from collections import deque
+from pathlib import Path
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from ai_sleepwalker.constants import MAX_EXPLORATION_DEPTH
+from ai_sleepwalker.experiences.base import ExperienceResult, Observation
+from ai_sleepwalker.main import (
+    MAX_SAVED_DREAMS,
+    SUBDIRECTORY_SAMPLE_SIZE,
+    explore_directory,
+    get_file_preview,
+    load_saved_dreams,
+    record_saved_dream,
+    save_dream,
+    select_random_subdirectory,
+    sleepwalk_cycle,
+)
+from tests.fixtures.test_doubles import FakeExperienceSynthesizer
+
+
+class TestGetFilePreview:
+    """Test the short content previews attached to file discoveries."""
+
+    def test_collapses_whitespace(self, temp_dir: Path) -> None:
+        """Test that previews are a single line of text."""
+        path = temp_dir / "poem.txt"
+        path.write_text("roses  are\n\tred\n")
+
+        assert get_file_preview(path) == "roses are red"
+
+    def test_truncates_long_content(self, temp_dir: Path) -> None:
+        """Test that long previews are cut with an ellipsis."""
+        path = temp_dir / "essay.txt"
+        path.write_text("word " * 100)
+
+        preview = get_file_preview(path)
+
+        assert preview is not None
+        assert len(preview) == 100
+        assert preview.endswith("...")
+
+    def test_binary_extension_is_not_read(self, temp_dir: Path) -> None:
+        """Test that known binary files are labelled instead of decoded."""
+        path = temp_dir / "photo.JPG"
+        path.write_bytes(b"\xff\xd8\xff\xe0")
+
+        assert get_file_preview(path) == "[Binary file]"
+
+    def test_binary_content_is_detected_without_extension(self, temp_dir: Path) -> None:
+        """Test that extensionless binaries are labelled from their bytes."""
+        elf = temp_dir / "tool"
+        elf.write_bytes(b"\x7fELF\x02\x01\x01" + bytes(64))
+        blob = temp_dir / "blob"
+        blob.write_bytes(b"abc\x00def")
+        noise = temp_dir / "noise"
+        noise.write_bytes(bytes(range(1, 32)) * 4 + b"some text")
+
+        assert get_file_preview(elf) == "[Binary file]"
+        assert get_file_preview(blob) == "[Binary file]"
+        assert get_file_preview(noise) == "[Binary file]"
+
+    def test_text_starting_like_a_signature_keeps_its_preview(
+        self, temp_dir: Path
+    ) -> None:
+        """Test that short magic-number lookalikes in text aren't binary."""
+        path = temp_dir / "names"
+        path.write_text("MZ Bank statements, 2024")
+        exe = temp_dir / "setup"
+        exe.write_bytes(
+            b"MZ\x90\x00\x03\x00\x00\x00\x04\x00" + bytes(54) + b"PE\x00\x00"
+        )
+
+        assert get_file_preview(path) == "MZ Bank statements, 2024"
+        assert get_file_preview(exe) == "[Binary file]"
+
+    def test_missing_or_empty_files_have_no_preview(self, temp_dir: Path) -> None:
+        """Test that unreadable and empty files yield None."""
+        empty = temp_dir / "empty.txt"
+        empty.write_text("")
+
+        assert get_file_preview(empty) is None
+        assert get_file_preview(temp_dir / "missing.txt") is None
+
+
+class TestExploreDirectory:
+    """Test directory exploration for sleepwalk cycles."""
+
+    def test_finds_files_and_directories(self, temp_dir: Path) -> None:
+        """Test that files and subdirectories are both discovered."""
+        (temp_dir / "notes").mkdir()
+        (temp_dir / "notes" / "journal.md").write_text("# Journal\n\nA quiet day.")
+        (temp_dir / "todo.txt").write_text("- water plants")
+
+        discoveries = explore_directory(temp_dir)
+
+        by_name = {d.name: d for d in discoveries}
+        assert by_name.keys() == {"notes", "journal.md", "todo.txt"}
+        assert by_name["notes"].is_directory
+        assert by_name["todo.txt"].size_bytes == len("- water plants")
+        assert by_name["journal.md"].preview == "# Journal A quiet day."
+
+    def test_respects_max_items(self, temp_dir: Path) -> None:
+        """Test that exploration stops once enough items are found."""
+        for i in range(10):
+            (temp_dir / f"file_{i}.txt").write_text("content")
+
+        assert len(explore_directory(temp_dir, max_items=3)) == 3
+
+    def test_lists_shallow_items_before_nested_ones(self, temp_dir: Path) -> None:
+        """Test that a directory's own entries come before its subtrees."""
+        (temp_dir / "deep" / "deeper").mkdir(parents=True)
+        (temp_dir / "deep" / "deeper" / "buried.txt").write_text("buried")
+        (temp_dir / "top.txt").write_text("top")
+
+        names = [d.name for d in explore_directory(temp_dir)]
+
+        assert names.index("top.txt") < names.index("buried.txt")
+        assert names.index("deep") < names.index("deeper")
+
+    def test_stops_at_max_depth(self, temp_dir: Path) -> None:
+        """Test that deeply nested entries are left unexplored."""
+        nested = temp_dir
+        for level in range(1, MAX_EXPLORATION_DEPTH + 2):
+            nested = nested / f"level_{level}"
+        nested.mkdir(parents=True)
+
+        names = {d.name for d in explore_directory(temp_dir)}
+
+        assert f"level_{MAX_EXPLORATION_DEPTH}" in names
+        assert f"level_{MAX_EXPLORATION_DEPTH + 1}" not in names
+
+    def test_preview_follows_file_changes(self, temp_dir: Path) -> None:
+        """Test that re-exploring picks up edits to a previewed file."""
+        note = temp_dir / "note.txt"
+        note.write_text("first draft")
+        assert explore_directory(temp_dir)[0].preview == "first draft"
+
+        note.write_text("second draft, longer")
+        stat = note.stat()
+        os.utime(note, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        assert explore_directory(temp_dir)[0].preview == "second draft, longer"
+
+    def test_skips_tool_directories(self, temp_dir: Path) -> None:
+        """Test that VCS and cache directories are not explored."""
+        (temp_dir / ".git" / "objects").mkdir(parents=True)
+        (temp_dir / ".git" / "HEAD").write_text("ref: refs/heads/main")
+        (temp_dir / "node_modules" / "pkg").mkdir(parents=True)
+        (temp_dir / "readme.md").write_text("# Readme")
+
+        names = {d.name for d in explore_directory(temp_dir)}
+
+        assert names == {"readme.md"}
+
+
+class TestSelectRandomSubdirectory:
+    """Test picking a subdirectory for a cycle to explore."""
+
+    def test_picks_visible_subdirectories(self, temp_dir: Path) -> None:
+        """Test that only non-hidden directories are chosen."""
+        for name in ("music", "photos", ".hidden"):
+            (temp_dir / name).mkdir()
+        (temp_dir / "notes.txt").write_text("notes")
+
+        picks = {select_random_subdirectory(temp_dir).name for _ in range(50)}
+
+        assert picks == {"music", "photos"}
+
+    def test_large_directories_are_sampled(self, temp_dir: Path) -> None:
+        """Test that picks from a huge directory come from a bounded sample."""
+        for i in range(SUBDIRECTORY_SAMPLE_SIZE * 3):
+            (temp_dir / f"dir_{i:03d}").mkdir()
+
+        # Stay inside one cache bucket so every pick uses the same sample
+        with patch("ai_sleepwalker.main.time.monotonic", return_value=0.0):
+            picks = {select_random_subdirectory(temp_dir).name for _ in range(500)}
+
+        assert 1 < len(picks) <= SUBDIRECTORY_SAMPLE_SIZE
+
+    def test_falls_back_to_base_path(self, temp_dir: Path) -> None:
+        """Test that the base path is used when it has no subdirectories."""
+        (temp_dir / "notes.txt").write_text("notes")
+
+        assert select_random_subdirectory(temp_dir) == temp_dir
+        assert select_random_subdirectory(temp_dir / "missing") == (
+            temp_dir / "missing"
+        )
+
+
+class TestSaveDream:
+    """Test writing dream files."""
+
+    def test_latest_dream_matches_new_dream(self, temp_dir: Path) -> None:
+        """Test that the latest dream file follows each new dream."""
+        latest = temp_dir / "latest_dream.md"
+        save_dream(temp_dir / "dream_0001.md", latest, "first")
+        save_dream(temp_dir / "dream_0002.md", latest, "second")
+
+        assert latest.read_text() == "second"
+        assert (temp_dir / "dream_0001.md").read_text() == "first"
+        assert sorted(p.name for p in temp_dir.iterdir()) == [
+            "dream_0001.md",
+            "dream_0002.md",
+            "latest_dream.md",
+        ]
+
+    def test_latest_dream_survives_rotation(self, temp_dir: Path) -> None:
+        """Test that deleting the numbered file keeps the latest dream."""
+        dream_file = temp_dir / "dream_0001.md"
+        latest = temp_dir / "latest_dream.md"
+        save_dream(dream_file, latest, "only dream")
+
+        dream_file.unlink()
+
+        assert latest.read_text() == "only dream"
+
+
+class TestSavedDreamRotation:
+    """Test that only the most recent dream files are kept."""
+
+    def test_oldest_dream_is_evicted_past_the_limit(self, temp_dir: Path) -> None:
+        """Test that recording one dream too many hands back the oldest."""
+        saved: deque[Path] = deque(maxlen=2)
+        evicted = [
+            record_saved_dream(saved, temp_dir / f"dream_{i:04d}.md") for i in range(3)
+        ]
+
+        assert evicted == [None, None, temp_dir / "dream_0000.md"]
+        assert list(saved) == [temp_dir / "dream_0001.md", temp_dir / "dream_0002.md"]
+
+    def test_rewritten_dream_is_not_evicted(self, temp_dir: Path) -> None:
+        """Test that reusing a file name doesn't evict the fresh file."""
+        saved: deque[Path] = deque(maxlen=2)
+        evicted = [
+            record_saved_dream(saved, temp_dir / name)
+            for name in ("dream_0001.md", "dream_0002.md", "dream_0001.md")
+        ]
+
+        assert evicted == [None, None, None]
+        assert list(saved) == [temp_dir / "dream_0002.md", temp_dir / "dream_0001.md"]
+
+    def test_load_trims_dreams_from_earlier_sessions(self, temp_dir: Path) -> None:
+        """Test that startup deletes the oldest-written dreams beyond the limit."""
+        # Numbering restarts each session, so low numbers can be the newest
+        total = MAX_SAVED_DREAMS + 5
+        for i in range(total):
+            dream_file = temp_dir / f"dream_{i:04d}.md"
+            dream_file.write_text("dream")
+            mtime_ns = (total - i) * 1_000_000_000
+            os.utime(dream_file, ns=(mtime_ns, mtime_ns))
+        (temp_dir / "latest_dream.md").write_text("dream")
+
+        saved = load_saved_dreams(temp_dir)
+
+        assert len(saved) == MAX_SAVED_DREAMS
+        assert saved[-1] == temp_dir / "dream_0000.md"
+        assert not (temp_dir / f"dream_{total - 5:04d}.md").exists()
+        assert (temp_dir / f"dream_{total - 6:04d}.md").exists()
+        assert (temp_dir / "latest_dream.md").exists()
+
+
+class HangingSynthesizer(FakeExperienceSynthesizer):
+    """Synthesizer whose dream never arrives."""
+
+    async def synthesize(self, observations: list[Observation]) -> ExperienceResult:
+        await asyncio.Event().wait()
+        raise AssertionError("unreachable")
+
+
+class TestSleepwalkCycle:
+    """Test one exploration and dream cycle."""
+
+    async def test_dream_timeout_is_reported_and_skips_saving(
+        self, temp_dir: Path, caplog: pytest.LogCaptureFixture
+    ) -> None:
+        """Test that a synthesis past its deadline is logged as a timeout."""
+        search_dir = temp_dir / "home"
+        search_dir.mkdir()
+        (search_dir / "notes.txt").write_text("notes for the dream")
+        output_dir = temp_dir / "dreams"
+        output_dir.mkdir()
+
+        # Skip the meditation pause that follows a failed dream
+        with (
+            patch("ai_sleepwalker.main.asyncio.sleep", new_callable=AsyncMock),
+            caplog.at_level(logging.ERROR, logger="ai_sleepwalker.main"),
+        ):
+            await sleepwalk_cycle(
+                1,
+                [search_dir],
+                output_dir,
+                deque(maxlen=MAX_SAVED_DREAMS),
+                HangingSynthesizer(),
+                dream_timeout=0.05,
+            )
+
+        assert "timed out" in caplog.text
+        assert list(output_dir.iterdir()) == []
@@ -4,7 +4,11 @@ from datetime import datetime
 
 import pytest
 
-from ai_sleepwalker.core.prompts import DREAM_PROMPT_TEMPLATE, format_dream_prompt
+from ai_sleepwalker.core.prompts import (
+    DREAM_PROMPT_PREFIX,
+    DREAM_PROMPT_TEMPLATE,
+    format_dream_prompt,
+)
 from ai_sleepwalker.experiences.base import Observation
 
 
@@ -159,6 +163,45 @@ class TestDreamPromptFormatting:
         assert "2048 bytes" in prompt  # Size should be included
         assert "2024-01-15" in prompt  # Date should be included
 
+    def test_prompt_starts_with_static_prefix(
+        self,
+        simple_observations: list[Observation],
+        complex_observations: list[Observation],
+    ) -> None:
+        """Test that only the end of the prompt varies between calls."""
+        for observations in (simple_observations, complex_observations, []):
+            prompt = format_dream_prompt(observations)
+
+            assert prompt.startswith(DREAM_PROMPT_PREFIX)
+            assert "{observations}" not in DREAM_PROMPT_PREFIX
+
+        # Discoveries come after all of the static instructions
+        prompt = format_dream_prompt(simple_observations)
+        assert prompt.index("old_photo.jpg") > len(DREAM_PROMPT_PREFIX)
+
+    def test_prompt_is_independent_of_observation_order(
+        self, complex_observations: list[Observation]
+    ) -> None:
+        """Test that the same discoveries always produce the same prompt."""
+        prompt = format_dream_prompt(complex_observations)
+
+        assert format_dream_prompt(complex_observations[::-1]) == prompt
+
+    def test_long_previews_are_truncated(self) -> None:
+        """Test that one huge preview can't blow up the prompt."""
+        obs = Observation(
+            timestamp=datetime(2024, 1, 15),
+            path="/home/user/big.log",
+            name="big.log",
+            type="file",
+            preview="x" * 100_000,
+        )
+
+        prompt = format_dream_prompt([obs])
+
+        assert "x" * 100 in prompt
+        assert len(prompt) < len(DREAM_PROMPT_PREFIX) + 2000
+
     def test_observation_capitalization_in_prompt(
         self, simple_observations: list[Observation]
     ) -> None: